@@ -9,44 +9,80 @@ This demonstrates:
 - Multi-turn conversation flow
 """
 
+import argparse
+import asyncio
+import logging
 import os
 import sys
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+# Trace output goes through logging so formatting is lazy and the
+# per-message prints can be silenced (DEMO_QUIET=1) when benchmarking
+logger = logging.getLogger("demo")
 
-from src.agents.base_agent import BaseAgent
-from src.agents.squad_leader import SquadLeaderAgent
-from src.agents.speaking_criteria import (
-    KeywordCriteria,
-    CompositeCriteria,
-    DirectAddressCriteria
-)
-from src.channel.shared_channel import SharedChannel
-from src.orchestration.orchestrator import Orchestrator
+
+# Separator lines built once instead of per print_separator call
+_WIDTH = 80
+_EQ_LINE = "=" * _WIDTH
+_DASH_LINE = "-" * _WIDTH
 
 
 def print_separator(title=""):
     """Print a visual separator."""
-    width = 80
     if title:
-        print(f"\n{'=' * width}")
-        print(f"{title.center(width)}")
-        print(f"{'=' * width}\n")
+        print(f"\n{_EQ_LINE}")
+        print(f"{title.center(_WIDTH)}")
+        print(f"{_EQ_LINE}\n")
     else:
-        print(f"\n{'-' * width}\n")
+        print(f"\n{_DASH_LINE}\n")
+
+
+# Set from argv/environment in main(); checked by maybe_pause()
+NON_INTERACTIVE = False
+
 
+def maybe_pause(prompt="Press Enter to continue to next scenario..."):
+    """Pause for user input unless the demo is running non-interactively.
 
-def main():
+    Non-interactive mode (via --non-interactive or DEMO_NONINTERACTIVE=1)
+    lets the demo run end-to-end in CI or as a benchmark harness.
+    """
+    if not NON_INTERACTIVE:
+        input(prompt)
+
+
+def parse_args():
+    """Parse command-line arguments for the demo."""
+    parser = argparse.ArgumentParser(description="Multi-agent collaboration demo")
+    parser.add_argument(
+        "--non-interactive",
+        action="store_true",
+        help="Run all scenarios without pausing for Enter between them"
+    )
+    return parser.parse_args()
+
+
+async def main():
     """Run the demo."""
+    global NON_INTERACTIVE
+    args = parse_args()
+    NON_INTERACTIVE = args.non_interactive or bool(os.environ.get("DEMO_NONINTERACTIVE"))
+
+    log_level = logging.WARNING if os.environ.get("DEMO_QUIET") else logging.INFO
+    logging.basicConfig(level=log_level, format="%(message)s")
+
     print_separator("MULTI-AGENT COLLABORATION DEMO")
 
-    # Check for API key
-    if not os.getenv("ANTHROPIC_API_KEY"):
-        print("ERROR: ANTHROPIC_API_KEY environment variable not set")
-        print("Please set your Anthropic API key:")
-        print("  export ANTHROPIC_API_KEY='your-key-here'")
-        sys.exit(1)
+    # Import lazily so --help and the API-key error path skip the cost of
+    # loading the agent stack (anthropic SDK, pydantic, MCP client)
+    from src.agents.base_agent import BaseAgent
+    from src.agents.squad_leader import SquadLeaderAgent
+    from src.agents.speaking_criteria import (
+        KeywordCriteria,
+        CompositeCriteria,
+        DirectAddressCriteria
+    )
+    from src.channel.shared_channel import SharedChannel
+    from src.orchestration.orchestrator import Orchestrator
 
     print("Initializing multi-agent system...")
     print("Creating shared communication channel...")
@@ -104,17 +140,11 @@ EXPERTISE AREAS:
     print("Expected: Squad leader responds\n")
 
     user_msg = "What's our current status?"
-    print(f"[USER] {user_msg}\n")
+    logger.info("[USER] %s\n", user_msg)
 
-    orchestrator.run_turn(user_message=user_msg)
+    await orchestrator.run_turn_and_report(user_message=user_msg)
 
-    # Show responses
-    recent = channel.get_recent_messages(3)
-    for msg in recent:
-        if msg.sender_id not in ["user", "system"]:
-            print(f"[{msg.sender_callsign}] {msg.content}\n")
-
-    input("Press Enter to continue to next scenario...")
+    maybe_pause()
 
     # Scenario 2: Direct address to specialist
     print_separator("SCENARIO 2: Direct Address to Specialist")
@@ -122,17 +152,11 @@ EXPERTISE AREAS:
     print("Expected: Specialist responds\n")
 
     user_msg = "Alpha One, I need you to analyze this data pattern we've been seeing."
-    print(f"[USER] {user_msg}\n")
-
-    orchestrator.run_turn(user_message=user_msg)
+    logger.info("[USER] %s\n", user_msg)
 
-    # Show responses
-    recent = channel.get_recent_messages(3)
-    for msg in recent:
-        if msg.sender_id not in ["user", "system"]:
-            print(f"[{msg.sender_callsign}] {msg.content}\n")
+    await orchestrator.run_turn_and_report(user_message=user_msg)
 
-    input("Press Enter to continue to next scenario...")
+    maybe_pause()
 
     # Scenario 3: Keyword trigger
     print_separator("SCENARIO 3: Keyword Trigger")
@@ -140,17 +164,11 @@ EXPERTISE AREAS:
     print("Expected: Specialist responds to expertise request\n")
 
     user_msg = "We have a problem with our data analysis pipeline. Need help analyzing the patterns."
-    print(f"[USER] {user_msg}\n")
-
-    orchestrator.run_turn(user_message=user_msg, max_agent_responses=2)
+    logger.info("[USER] %s\n", user_msg)
 
-    # Show responses
-    recent = channel.get_recent_messages(4)
-    for msg in recent:
-        if msg.sender_id not in ["user", "system"]:
-            print(f"[{msg.sender_callsign}] {msg.content}\n")
+    await orchestrator.run_turn_and_report(user_message=user_msg, max_agent_responses=2)
 
-    input("Press Enter to continue to next scenario...")
+    maybe_pause()
 
     # Scenario 4: Agent-to-agent communication
     print_separator("SCENARIO 4: Inter-Agent Communication")
@@ -163,20 +181,18 @@ EXPERTISE AREAS:
         content="Alpha One, this is Alpha Lead, requesting status on analysis task, over.",
         sender_callsign=leader.callsign
     )
-    print(f"[{leader.callsign}] {leader_msg.content}\n")
+    logger.info("[%s] %s\n", leader.callsign, leader_msg.content)
 
-    # Process specialist response
-    orchestrator.process_responses(max_responses=1)
-
-    # Show response
-    recent = channel.get_recent_messages(2)
-    for msg in recent:
+    # Process specialist response and report it directly
+    responses = await orchestrator.process_responses(max_responses=1)
+    for msg in responses:
         if msg.sender_id == specialist.agent_id:
-            print(f"[{msg.sender_callsign}] {msg.content}\n")
+            logger.info("[%s] %s\n", msg.sender_callsign, msg.content)
 
-    # Show full conversation history
+    # Show full conversation history (single write, no per-line flush)
     print_separator("FULL CONVERSATION HISTORY")
-    print(channel.format_history(30))
+    sys.stdout.write(channel.format_history(30))
+    sys.stdout.write("\n")
 
     print_separator("DEMO COMPLETE")
     print("This demo showed:")
@@ -193,4 +209,12 @@ EXPERTISE AREAS:
 
 
 if __name__ == "__main__":
-    main()
+    # Fail fast on a missing API key before starting the event loop or
+    # importing the agent stack
+    if not os.environ.get("ANTHROPIC_API_KEY"):
+        print("ERROR: ANTHROPIC_API_KEY environment variable not set")
+        print("Please set your Anthropic API key:")
+        print("  export ANTHROPIC_API_KEY='your-key-here'")
+        sys.exit(1)
+
+    asyncio.run(main())
@@ -12,42 +12,76 @@ Features:
 - Voice net protocol communications
 """
 
+import argparse
+import logging
 import os
 import sys
 import asyncio
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+# Trace output goes through logging so formatting is lazy and the
+# per-message prints can be silenced (DEMO_QUIET=1) when benchmarking
+logger = logging.getLogger("demo_aerospace")
 
-from src.agents.squad_leader import SquadLeaderAgent
-from src.agents.aerospace_agent import AerospaceAgent
-from src.agents.speaking_criteria import KeywordCriteria, CompositeCriteria, DirectAddressCriteria
-from src.channel.shared_channel import SharedChannel
-from src.orchestration.orchestrator import Orchestrator
-from src.mcp.mcp_manager import initialize_aerospace_mcp, get_mcp_manager
+
+# Separator lines built once instead of per print_separator call
+_WIDTH = 80
+_EQ_LINE = "=" * _WIDTH
+_DASH_LINE = "-" * _WIDTH
 
 
 def print_separator(title=""):
     """Print a visual separator."""
-    width = 80
     if title:
-        print(f"\n{'=' * width}")
-        print(f"{title.center(width)}")
-        print(f"{'=' * width}\n")
+        print(f"\n{_EQ_LINE}")
+        print(f"{title.center(_WIDTH)}")
+        print(f"{_EQ_LINE}\n")
     else:
-        print(f"\n{'-' * width}\n")
+        print(f"\n{_DASH_LINE}\n")
+
+
+# Set from argv/environment in main(); checked by maybe_pause()
+NON_INTERACTIVE = False
+
+
+def maybe_pause(prompt="Press Enter to continue to next scenario..."):
+    """Pause for user input unless the demo is running non-interactively.
+
+    Non-interactive mode (via --non-interactive or DEMO_NONINTERACTIVE=1)
+    lets the demo run end-to-end in CI or as a benchmark harness.
+    """
+    if not NON_INTERACTIVE:
+        input(prompt)
+
+
+def parse_args():
+    """Parse command-line arguments for the demo."""
+    parser = argparse.ArgumentParser(description="Aerospace MCP integration demo")
+    parser.add_argument(
+        "--non-interactive",
+        action="store_true",
+        help="Run all scenarios without pausing for Enter between them"
+    )
+    return parser.parse_args()
 
 
 async def main():
     """Run the aerospace MCP integration demo."""
+    global NON_INTERACTIVE
+    args = parse_args()
+    NON_INTERACTIVE = args.non_interactive or bool(os.environ.get("DEMO_NONINTERACTIVE"))
+
+    log_level = logging.WARNING if os.environ.get("DEMO_QUIET") else logging.INFO
+    logging.basicConfig(level=log_level, format="%(message)s")
+
     print_separator("AEROSPACE MCP INTEGRATION DEMO")
 
-    # Check for API key
-    if not os.getenv("ANTHROPIC_API_KEY"):
-        print("ERROR: ANTHROPIC_API_KEY environment variable not set")
-        print("Please set your Anthropic API key:")
-        print("  export ANTHROPIC_API_KEY='your-key-here'")
-        sys.exit(1)
+    # Import lazily so --help and the API-key error path skip the cost of
+    # loading the agent stack (anthropic SDK, pydantic, MCP client)
+    from src.agents.squad_leader import SquadLeaderAgent
+    from src.agents.aerospace_agent import AerospaceAgent
+    from src.channel.shared_channel import SharedChannel
+    from src.orchestration.orchestrator import Orchestrator
+    from src.mcp.mcp_manager import initialize_aerospace_mcp, get_mcp_manager
 
     print("Initializing multi-agent aerospace system...")
     print("Connecting to Aerospace MCP server...\n")
@@ -100,66 +134,62 @@ async def main():
 
     print("\nAgents are ready. Beginning aerospace mission scenarios...")
 
-    # Scenario 1: Flight planning request
-    print_separator("SCENARIO 1: Flight Planning Mission")
-    print("User requests flight plan from San Francisco to Tokyo.")
-    print("Expected: Aerospace specialist uses MCP tools\n")
-
-    user_msg = "Hawk One, I need a flight plan from San Francisco to Tokyo using a Boeing 777-300ER."
-    print(f"[USER] {user_msg}\n")
-
-    orchestrator.run_turn(user_message=user_msg)
-
-    # Show responses
-    recent = channel.get_recent_messages(5)
-    for msg in recent:
-        if msg.sender_id not in ["user", "system"]:
-            print(f"[{msg.sender_callsign}] {msg.content}\n")
+    # Scenario definitions: (title, description, user message, max responses)
+    scenarios = [
+        (
+            "SCENARIO 1: Flight Planning Mission",
+            "User requests flight plan from San Francisco to Tokyo.\n"
+            "Expected: Aerospace specialist uses MCP tools",
+            "Hawk One, I need a flight plan from San Francisco to Tokyo using a Boeing 777-300ER.",
+            3
+        ),
+        (
+            "SCENARIO 2: Airport Intelligence Request",
+            "User asks about airports in a specific city.\n"
+            "Expected: Aerospace specialist queries airport database",
+            "What airports are available in London?",
+            3
+        ),
+        (
+            "SCENARIO 3: Mission Coordination",
+            "User asks general question about capabilities.\n"
+            "Expected: Squad leader coordinates response",
+            "What aerospace analysis capabilities do we have?",
+            2
+        ),
+    ]
+
+    print_separator("DISPATCHING MISSION SCENARIOS")
+    for title, description, user_msg, _ in scenarios:
+        print(f"{title}")
+        print(f"{description}")
+        logger.info("[USER] %s\n", user_msg)
+
+    # Run all turns concurrently: each turn is dominated by LLM and MCP
+    # round-trip latency, so gathering them overlaps the I/O instead of
+    # paying for each turn serially.
+    turns = await asyncio.gather(*[
+        orchestrator.run_turn(user_message=user_msg, max_agent_responses=max_responses)
+        for _, _, user_msg, max_responses in scenarios
+    ])
+
+    # Show responses per scenario
+    for i, ((title, _, _, _), turn_data) in enumerate(zip(scenarios, turns)):
+        if i:
+            maybe_pause()
+        print_separator(title)
+        for msg in turn_data["agent_responses"]:
+            logger.info("[%s] %s\n", msg.sender_callsign, msg.content)
 
     print("\n[INFO] The aerospace agent has access to these MCP tools:")
     print("  • plan_flight - Calculate flight plans with fuel estimates")
     print("  • airports_by_city - Search for airports")
     print("  • And 30+ other aerospace analysis tools\n")
 
-    input("Press Enter to continue to next scenario...")
-
-    # Scenario 2: Airport information
-    print_separator("SCENARIO 2: Airport Intelligence Request")
-    print("User asks about airports in a specific city.")
-    print("Expected: Aerospace specialist queries airport database\n")
-
-    user_msg = "What airports are available in London?"
-    print(f"[USER] {user_msg}\n")
-
-    orchestrator.run_turn(user_message=user_msg)
-
-    # Show responses
-    recent = channel.get_recent_messages(5)
-    for msg in recent[-3:]:
-        if msg.sender_id not in ["user", "system"]:
-            print(f"[{msg.sender_callsign}] {msg.content}\n")
-
-    input("Press Enter to continue to next scenario...")
-
-    # Scenario 3: Squad coordination
-    print_separator("SCENARIO 3: Mission Coordination")
-    print("User asks general question about capabilities.")
-    print("Expected: Squad leader coordinates response\n")
-
-    user_msg = "What aerospace analysis capabilities do we have?"
-    print(f"[USER] {user_msg}\n")
-
-    orchestrator.run_turn(user_message=user_msg, max_agent_responses=2)
-
-    # Show responses
-    recent = channel.get_recent_messages(5)
-    for msg in recent[-4:]:
-        if msg.sender_id not in ["user", "system"]:
-            print(f"[{msg.sender_callsign}] {msg.content}\n")
-
-    # Show full conversation history
+    # Show full conversation history (single write, no per-line flush)
     print_separator("FULL MISSION TRANSCRIPT")
-    print(channel.format_history(30))
+    sys.stdout.write(channel.format_history(30))
+    sys.stdout.write("\n")
 
     print_separator("DEMO COMPLETE")
     print("This demonstration showed:")
@@ -183,4 +213,12 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Fail fast on a missing API key before starting the event loop or
+    # importing the agent stack
+    if not os.environ.get("ANTHROPIC_API_KEY"):
+        print("ERROR: ANTHROPIC_API_KEY environment variable not set")
+        print("Please set your Anthropic API key:")
+        print("  export ANTHROPIC_API_KEY='your-key-here'")
+        sys.exit(1)
+
     asyncio.run(main())
@@ -12,25 +12,33 @@ We'll demonstrate:
 """
 
 import asyncio
+import io
 import os
 import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent))
-
 from src.mcp.mcp_manager import get_mcp_manager, initialize_aerospace_mcp
 
 
+# Separator lines built once instead of per print_header call
+_WIDTH = 80
+_EQ_LINE = "=" * _WIDTH
+_DASH_LINE = "-" * _WIDTH
+
+
 def print_header(title: str):
     """Print a formatted header."""
-    print("\n" + "=" * 80)
-    print(title.center(80))
-    print("=" * 80 + "\n")
+    print("\n" + _EQ_LINE)
+    print(title.center(_WIDTH))
+    print(_EQ_LINE + "\n")
 
 
-async def demo_direct_tool_call():
-    """Demonstrate direct MCP tool call for airport search."""
+async def demo_direct_tool_call(mcp_manager):
+    """Demonstrate direct MCP tool call for airport search.
+
+    Args:
+        mcp_manager: Shared MCPManager instance from main()
+    """
     print_header("DEMO 1: Direct MCP Tool Call (What Works Now)")
     
     print("This demonstrates calling aerospace-mcp tools directly via MCPManager.")
@@ -50,9 +58,6 @@ async def demo_direct_tool_call():
         print("   Make sure aerospace-mcp is installed in the parent directory")
         return False
 
-    # Get the manager instance
-    mcp_manager = await get_mcp_manager()
-
     print("✅ MCP server connected\n")
     
     # List available tools
@@ -65,100 +70,95 @@ async def demo_direct_tool_call():
         print(f"  • {tool['name']}: {tool['description'][:60]}...")
     print(f"  ... and {len(tools) - 5} more\n")
     
-    # Demo 1: Search for airports in San Francisco
-    print_header("Example 1: Search for airports in San Francisco")
-    
-    print("🔍 Calling: search_airports(query='San Francisco')\n")
-    
-    try:
-        result = await mcp_manager.call_tool(
-            server_name="aerospace-mcp",
-            tool_name="search_airports",
-            arguments={"query": "San Francisco"}
-        )
-        
-        if result and hasattr(result, 'content') and result.content:
-            response_text = result.content[0].text
-            print("📊 Result:")
-            print("-" * 80)
-            print(response_text)
-            print("-" * 80)
-        else:
-            print("❌ No result returned")
-            return False
-            
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-    
-    # Demo 2: Search for a specific airport code
-    print_header("Example 2: Search for LAX airport")
-    
-    print("🔍 Calling: search_airports(query='LAX')\n")
-    
-    try:
-        result = await mcp_manager.call_tool(
-            server_name="aerospace-mcp",
-            tool_name="search_airports",
-            arguments={"query": "LAX"}
-        )
-        
-        if result and hasattr(result, 'content') and result.content:
-            response_text = result.content[0].text
-            print("📊 Result:")
-            print("-" * 80)
-            print(response_text)
-            print("-" * 80)
-        else:
-            print("❌ No result returned")
-            return False
-            
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        return False
-    
-    # Demo 3: Calculate distance between airports
-    print_header("Example 3: Calculate distance between LAX and JFK")
-
-    print("🔍 Calling: calculate_distance()")
-    print("   LAX: 33.9425°N, 118.4081°W")
-    print("   JFK: 40.6413°N, 73.7781°W\n")
-
-    try:
-        result = await mcp_manager.call_tool(
-            server_name="aerospace-mcp",
-            tool_name="calculate_distance",
-            arguments={
+    async def call_example(title, call_line, tool_name, arguments):
+        """Run one tool call, returning (title, call_line, text, error)."""
+        try:
+            result = await mcp_manager.call_tool(
+                server_name="aerospace-mcp",
+                tool_name=tool_name,
+                arguments=arguments
+            )
+
+            if result and hasattr(result, 'content') and result.content:
+                return (title, call_line, result.content[0].text, None)
+            return (title, call_line, None, "No result returned")
+
+        except Exception as e:
+            return (title, call_line, None, str(e))
+
+    # The three example calls have no data dependency, so dispatch them
+    # concurrently: total latency is the slowest call rather than the sum.
+    sf_example, lax_example, distance_example = await asyncio.gather(
+        call_example(
+            "Example 1: Search for airports in San Francisco",
+            "🔍 Calling: search_airports(query='San Francisco')\n",
+            "search_airports",
+            {"query": "San Francisco"}
+        ),
+        call_example(
+            "Example 2: Search for LAX airport",
+            "🔍 Calling: search_airports(query='LAX')\n",
+            "search_airports",
+            {"query": "LAX"}
+        ),
+        call_example(
+            "Example 3: Calculate distance between LAX and JFK",
+            "🔍 Calling: calculate_distance()\n"
+            "   LAX: 33.9425°N, 118.4081°W\n"
+            "   JFK: 40.6413°N, 73.7781°W\n",
+            "calculate_distance",
+            {
                 "lat1": 33.9425,
                 "lon1": -118.4081,
                 "lat2": 40.6413,
                 "lon2": -73.7781
             }
-        )
-
-        if result and hasattr(result, 'content') and result.content:
-            response_text = result.content[0].text
-            print("📊 Result:")
-            print("-" * 80)
-            print(response_text)
-            print("-" * 80)
-
-            # Check if the result contains an error
-            if "error" in response_text.lower():
-                print("\n⚠️  Warning: Tool returned an error message")
-                print("   This is a known issue with the aerospace-mcp calculate_distance tool")
-                print("   The other tools (search_airports, plan_flight) work correctly")
-                # Don't fail the demo for this known issue
-        else:
-            print("❌ No result returned")
-
-    except Exception as e:
-        print(f"⚠️  Error calling calculate_distance: {e}")
-        print("   This is a known issue with this specific tool")
-
-    print("\n✅ Airport search tools working successfully!")
+        ),
+        return_exceptions=False
+    )
+
+    # Render each example into a buffer and emit it with one stdout write,
+    # instead of a dozen individual print calls per example.
+    def write_header(buf, header_title):
+        buf.write(f"\n{_EQ_LINE}\n{header_title.center(_WIDTH)}\n{_EQ_LINE}\n\n")
+
+    # The search examples must succeed for the demo to continue
+    for title, call_line, response_text, error in (sf_example, lax_example):
+        buf = io.StringIO()
+        write_header(buf, title)
+        buf.write(call_line + "\n")
+
+        if error:
+            buf.write(f"❌ Error: {error}\n")
+            sys.stdout.write(buf.getvalue())
+            sys.stdout.flush()
+            return False
+
+        buf.write(f"📊 Result:\n{_DASH_LINE}\n{response_text}\n{_DASH_LINE}\n")
+        sys.stdout.write(buf.getvalue())
+
+    # The distance example tolerates failure (known aerospace-mcp issue)
+    title, call_line, response_text, error = distance_example
+    buf = io.StringIO()
+    write_header(buf, title)
+    buf.write(call_line + "\n")
+
+    if error:
+        buf.write(f"⚠️  Error calling calculate_distance: {error}\n")
+        buf.write("   This is a known issue with this specific tool\n")
+    else:
+        buf.write(f"📊 Result:\n{_DASH_LINE}\n{response_text}\n{_DASH_LINE}\n")
+
+        # Check if the result contains an error
+        if "error" in response_text.lower():
+            buf.write("\n⚠️  Warning: Tool returned an error message\n")
+            buf.write("   This is a known issue with the aerospace-mcp calculate_distance tool\n")
+            buf.write("   The other tools (search_airports, plan_flight) work correctly\n")
+            # Don't fail the demo for this known issue
+
+    buf.write("\n✅ Airport search tools working successfully!\n")
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
     return True
 
 
@@ -170,12 +170,12 @@ async def demo_what_agent_would_do():
     print("Currently, this is NOT implemented in BaseAgent.\n")
     
     print("📝 Hypothetical Scenario:")
-    print("-" * 80)
+    print(_DASH_LINE)
     print("USER: 'Alpha One, search for airports near Los Angeles and tell me")
     print("       about the largest one.'\n")
     
     print("🤖 What the agent WOULD do (if integrated):")
-    print("-" * 80)
+    print(_DASH_LINE)
     print()
     print("Step 1: Claude receives the message with available tools")
     print("  • Agent sees user wants airport information")
@@ -202,12 +202,12 @@ async def demo_what_agent_would_do():
     print("  • Crafts natural language response")
     print()
     print("🤖 AGENT RESPONSE:")
-    print("-" * 80)
+    print(_DASH_LINE)
     print("Alpha One, roger. I found several airports in the Los Angeles area.")
     print("The largest is Los Angeles International Airport (LAX), located at")
     print("33.9425°N, 118.4081°W. LAX is a major international hub serving the")
     print("greater Los Angeles metropolitan area. Over.")
-    print("-" * 80)
+    print(_DASH_LINE)
     print()
     
     print("❌ CURRENT STATUS: This workflow is NOT implemented")
@@ -233,9 +233,13 @@ async def main():
     print("  📋 What agent integration would look like (not yet implemented)")
     print()
 
+    # Fetch the manager once and thread it through; the finally block
+    # reuses it rather than dispatching get_mcp_manager again
+    manager = await get_mcp_manager()
+
     try:
         # Demo 1: Direct tool calls (works now)
-        success = await demo_direct_tool_call()
+        success = await demo_direct_tool_call(manager)
 
         if not success:
             print("\n❌ Direct tool calls failed. Check MCP server setup.")
@@ -266,7 +270,6 @@ async def main():
 
     finally:
         # Clean up MCP connections
-        manager = await get_mcp_manager()
         await manager.cleanup()
 
 
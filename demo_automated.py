@@ -13,6 +13,10 @@ Perfect for:
 """
 
 import asyncio
+import hashlib
+import io
+import itertools
+import re
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -25,21 +29,128 @@ from src.agents.base_agent import BaseAgent
 from src.agents.squad_leader import SquadLeaderAgent
 from src.channel.shared_channel import SharedChannel
 from src.orchestration.orchestrator import Orchestrator
+from src.config import AEROSPACE_MCP_PATH, HAS_MCP
 from src.mcp.mcp_manager import get_mcp_manager, initialize_aerospace_mcp
 from src.state.state_manager import StateManager
 
 
+# Separator lines built once instead of per print_header/print_section call
+_WIDTH = 80
+_EQ_LINE = "=" * _WIDTH
+_DASH_LINE = "─" * _WIDTH
+
+# ANSI color table built once at import instead of per print_message call
+_COLORS = {
+    "blue": "\033[94m",
+    "green": "\033[92m",
+    "yellow": "\033[93m",
+    "cyan": "\033[96m",
+    "red": "\033[91m",
+}
+_COLOR_END = "\033[0m"
+
+# Callsigns used by the scripted scenario, precompiled for sizing
+# max_agent_responses per turn
+_CALLSIGN_RE = re.compile(
+    r"\b(?:Rescue Lead|Alpha (?:One|Two|Three))\b", re.IGNORECASE
+)
+_ALL_STATIONS_RE = re.compile(r"\ball stations\b", re.IGNORECASE)
+
+
+# Agent system prompts, interned once at import: repeated demo setups
+# share one string object per prompt instead of re-allocating the
+# multiline literals on every run
+_RESCUE_LEAD_PROMPT = sys.intern("""You are RESCUE-LEAD, the mission commander for Coast Guard SAR operations.
+Your role: Coordinate the team, delegate tasks, ensure mission success.
+Keep responses concise (2-3 sentences max).
+Use directed communication: "[Callsign], [task], over." """)
+
+_FLIGHT_PLANNER_PROMPT = sys.intern("""You are ALPHA-ONE, flight planning specialist.
+Expertise: Route planning, fuel calculations, airport selection.
+Keep responses brief (2-3 sentences). Use tools when available.""")
+
+_NAVIGATOR_PROMPT = sys.intern("""You are ALPHA-TWO, navigation specialist.
+Expertise: Distance calculations, coordinate tracking, position reporting.
+Keep responses brief (2-3 sentences).""")
+
+_WEATHER_OFFICER_PROMPT = sys.intern("""You are ALPHA-THREE, weather and conditions officer.
+Expertise: Weather analysis, risk assessment, operational safety.
+Keep responses brief (2-3 sentences).""")
+
+
+class ResponseCache:
+    """In-memory cache of agent responses for identical scripted turns.
+
+    The scripted scenario replays the same prompts on every run, and each
+    one costs a full LLM round-trip. Caching the responses keyed on the
+    message plus the agent roster and context window turns a repeated turn
+    into a dict lookup instead of another set of API calls.
+    """
+
+    def __init__(self):
+        self._entries = {}
+
+    @staticmethod
+    def make_key(message: str, agents, context_window: int) -> str:
+        """Build a cache key for a turn.
+
+        Args:
+            message: The user message for the turn
+            agents: Agents currently on the roster
+            context_window: Orchestrator context window size
+
+        Returns:
+            Hex digest uniquely identifying the turn configuration
+        """
+        roster = ",".join(sorted(a.agent_id for a in agents))
+        raw = f"{message}|{roster}|{context_window}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def get(self, key: str):
+        """Return the cached response entries for key, or None on miss."""
+        return self._entries.get(key)
+
+    def put(self, key: str, responses):
+        """Cache the responses for a turn.
+
+        Args:
+            key: Cache key from make_key
+            responses: Messages generated by agents this turn
+        """
+        # Store add_message kwargs rather than live Message objects so a
+        # replay can re-post them onto a fresh channel
+        self._entries[key] = [
+            {
+                "sender_id": msg.sender_id,
+                "content": msg.content,
+                "sender_callsign": msg.sender_callsign,
+                "message_type": msg.message_type
+            }
+            for msg in responses
+        ]
+
+
 class AutomatedDemo:
     """Runs an automated demo with pre-scripted messages."""
 
-    def __init__(self, delay_between_turns: float = 2.0, show_metrics: bool = True):
+    def __init__(self, delay_between_turns: float = 2.0, show_metrics: bool = True,
+                 use_cache: bool = True):
         self.orchestrator = None
         self.state_manager = None
         self.mcp_manager = None
-        self.delay = delay_between_turns
+        # The inter-turn delay is purely cosmetic pacing for a human
+        # watching the terminal; when output is piped (CI, log capture)
+        # it is dead idle time, so drop it entirely
+        self.delay = delay_between_turns if sys.stdout.isatty() else 0
         self.show_metrics = show_metrics
+        self.response_cache = ResponseCache() if use_cache else None
+
+        # Serializes display output when independent turns run concurrently
+        self._print_lock = asyncio.Lock()
 
-        # Metrics
+        # Metrics. Timestamps are perf_counter_ns integers: monotonic (no
+        # NTP steps mid-demo), high resolution, converted to seconds only
+        # at display time.
         self.metrics = {
             "turns": 0,
             "responses": 0,
@@ -49,33 +160,49 @@ class AutomatedDemo:
         }
 
     def print_header(self, text: str, char: str = "="):
-        """Print a formatted header."""
-        width = 80
-        print("\n" + char * width)
-        print(text.center(width))
-        print(char * width + "\n")
-
-    def print_message(self, sender: str, content: str, color: str = ""):
-        """Print a formatted message."""
-        colors = {
-            "blue": "\033[94m",
-            "green": "\033[92m",
-            "yellow": "\033[93m",
-            "cyan": "\033[96m",
-            "red": "\033[91m",
-            "end": "\033[0m"
-        }
-
-        if color and color in colors:
-            print(f"{colors[color]}[{sender}]: {content}{colors['end']}")
-        else:
-            print(f"[{sender}]: {content}")
+        """Print a formatted header with a single write."""
+        bar = _EQ_LINE if char == "=" else char * _WIDTH
+        sys.stdout.write(f"\n{bar}\n{text.center(_WIDTH)}\n{bar}\n\n")
+
+    def print_message(self, sender: str, content: str, color: str = "", out=None):
+        """Print a formatted message.
+
+        Args:
+            sender: Callsign shown in brackets
+            content: Message body
+            color: Optional key into the module color table
+            out: Writable stream (defaults to sys.stdout)
+        """
+        code = _COLORS.get(color, "")
+        (out or sys.stdout).write(
+            f"{code}[{sender}]: {content}{_COLOR_END if code else ''}\n"
+        )
 
     def print_section(self, title: str):
-        """Print a section header."""
-        print("\n" + "─" * 80)
-        print(f"  {title}")
-        print("─" * 80)
+        """Print a section header with a single write."""
+        sys.stdout.write(f"\n{_DASH_LINE}\n  {title}\n{_DASH_LINE}\n")
+
+    async def _connect_mcp(self):
+        """Connect to aerospace-mcp with a timeout.
+
+        Returns:
+            Tuple of (manager or None, status line to display)
+        """
+        try:
+            if HAS_MCP:
+                try:
+                    await asyncio.wait_for(
+                        initialize_aerospace_mcp(str(AEROSPACE_MCP_PATH)),
+                        timeout=10.0
+                    )
+                    manager = await get_mcp_manager()
+                    tools = manager.get_available_tools()
+                    return manager, f"✅ Connected! {len(tools)} aviation tools available"
+                except asyncio.TimeoutError:
+                    return None, "⚠️  Connection timeout - running without MCP tools"
+            return None, "⚠️  aerospace-mcp not found - running in mock mode"
+        except Exception as e:
+            return None, f"⚠️  MCP initialization error: {e}"
 
     async def setup(self):
         """Initialize the demo environment."""
@@ -85,34 +212,13 @@ class AutomatedDemo:
         print("Scenario: Coast Guard Search and Rescue Mission Planning")
         print()
 
-        # Initialize MCP (with timeout)
+        # Start the MCP handshake immediately so the (up to 10s) network
+        # wait overlaps with agent construction and DB init below. Agents
+        # only store the manager reference, so it is patched in once the
+        # connection resolves.
         self.print_section("Initializing Aviation Systems")
-
-        base_path = Path(__file__).parent.parent
-        aerospace_path = str(base_path / "aerospace-mcp")
-
-        try:
-            if Path(aerospace_path).exists():
-                print("🔧 Connecting to aerospace-mcp server...")
-
-                # Try to connect with timeout
-                try:
-                    await asyncio.wait_for(
-                        initialize_aerospace_mcp(aerospace_path),
-                        timeout=10.0
-                    )
-                    self.mcp_manager = await get_mcp_manager()
-                    tools = self.mcp_manager.get_available_tools()
-                    print(f"✅ Connected! {len(tools)} aviation tools available")
-                except asyncio.TimeoutError:
-                    print("⚠️  Connection timeout - running without MCP tools")
-                    self.mcp_manager = None
-            else:
-                print("⚠️  aerospace-mcp not found - running in mock mode")
-                self.mcp_manager = None
-        except Exception as e:
-            print(f"⚠️  MCP initialization error: {e}")
-            self.mcp_manager = None
+        print("🔧 Connecting to aerospace-mcp server...")
+        mcp_task = asyncio.create_task(self._connect_mcp())
 
         # Create agents
         self.print_section("Assembling Team")
@@ -120,37 +226,28 @@ class AutomatedDemo:
         squad_leader = SquadLeaderAgent(
             agent_id="squad_leader",
             callsign="RESCUE-LEAD",
-            mcp_manager=self.mcp_manager,
-            system_prompt="""You are RESCUE-LEAD, the mission commander for Coast Guard SAR operations.
-Your role: Coordinate the team, delegate tasks, ensure mission success.
-Keep responses concise (2-3 sentences max).
-Use directed communication: "[Callsign], [task], over." """
+            mcp_manager=None,
+            system_prompt=_RESCUE_LEAD_PROMPT
         )
 
         flight_planner = BaseAgent(
             agent_id="flight_planner",
             callsign="ALPHA-ONE",
-            mcp_manager=self.mcp_manager,
-            system_prompt="""You are ALPHA-ONE, flight planning specialist.
-Expertise: Route planning, fuel calculations, airport selection.
-Keep responses brief (2-3 sentences). Use tools when available."""
+            mcp_manager=None,
+            system_prompt=_FLIGHT_PLANNER_PROMPT
         )
 
         navigator = BaseAgent(
             agent_id="navigator",
             callsign="ALPHA-TWO",
-            mcp_manager=self.mcp_manager,
-            system_prompt="""You are ALPHA-TWO, navigation specialist.
-Expertise: Distance calculations, coordinate tracking, position reporting.
-Keep responses brief (2-3 sentences)."""
+            mcp_manager=None,
+            system_prompt=_NAVIGATOR_PROMPT
         )
 
         weather_officer = BaseAgent(
             agent_id="weather",
             callsign="ALPHA-THREE",
-            system_prompt="""You are ALPHA-THREE, weather and conditions officer.
-Expertise: Weather analysis, risk assessment, operational safety.
-Keep responses brief (2-3 sentences)."""
+            system_prompt=_WEATHER_OFFICER_PROMPT
         )
 
         print("👥 Team Roster:")
@@ -172,54 +269,115 @@ Keep responses brief (2-3 sentences)."""
         self.state_manager = StateManager()
         await self.state_manager.initialize_db()
 
+        # Local setup is done; resolve the MCP handshake started above and
+        # hand the manager to the tool-using agents
+        self.mcp_manager, mcp_status = await mcp_task
+        print(f"\n{mcp_status}")
+        for agent in (squad_leader, flight_planner, navigator):
+            agent.mcp_manager = self.mcp_manager
+
         print("\n✅ Demo initialized successfully")
 
+    @staticmethod
+    def _max_responses_for(message: str) -> int:
+        """Size the response cap from how the message is addressed.
+
+        A turn directed at a single callsign only needs one response slot;
+        polling the rest of the roster just burns LLM calls on no-ops. An
+        "All stations" broadcast should let the whole four-agent team
+        answer.
+
+        Args:
+            message: Outgoing user message
+
+        Returns:
+            max_agent_responses value for the turn
+        """
+        if _ALL_STATIONS_RE.search(message):
+            return 4
+
+        addressed = set(m.lower() for m in _CALLSIGN_RE.findall(message))
+        if len(addressed) == 1:
+            return 1
+
+        return 3
+
     async def send_and_display(self, message: str, description: str = ""):
-        """Send message and display responses."""
+        """Send message and display responses.
+
+        Safe to run concurrently with other turns: the LLM round-trips
+        overlap, and the display block is serialized by a lock so output
+        from interleaved turns stays readable.
+        """
         self.metrics["turns"] += 1
 
-        if description:
-            print(f"\n💭 {description}")
+        start = time.perf_counter_ns()
 
-        self.print_message("COMMAND", message, "yellow")
+        cache_key = None
+        if self.response_cache is not None:
+            cache_key = self.response_cache.make_key(
+                message,
+                self.orchestrator.get_active_agents(),
+                self.orchestrator.context_window
+            )
 
-        start = time.time()
+        cached = self.response_cache.get(cache_key) if cache_key else None
 
-        try:
-            turn_result = await asyncio.wait_for(
-                self.orchestrator.run_turn(
-                    user_message=message,
-                    max_agent_responses=3
-                ),
-                timeout=45.0
+        if cached is not None:
+            # Replay the cached responses onto the channel so history
+            # and metrics stay coherent, without any LLM round-trips
+            self.orchestrator.send_user_message(message)
+            turn_result = {
+                "agent_responses": self.orchestrator.channel.add_messages_bulk(cached)
+            }
+        else:
+            # Timeouts are enforced per agent inside run_turn, so a stuck
+            # agent is skipped and the rest still deliver; no blanket
+            # outer timeout that would discard partial results
+            turn_result = await self.orchestrator.run_turn(
+                user_message=message,
+                max_agent_responses=self._max_responses_for(message),
+                response_timeout=15.0
             )
+            if cache_key and turn_result["agent_responses"]:
+                self.response_cache.put(cache_key, turn_result["agent_responses"])
 
-            elapsed = time.time() - start
+        elapsed_ns = time.perf_counter_ns() - start
 
-            if turn_result["agent_responses"]:
-                print()
-                for response in turn_result["agent_responses"]:
-                    self.metrics["responses"] += 1
-                    callsign = response.sender_callsign or response.sender_id
+        # Render the whole turn into one buffer and emit it with a
+        # single write/flush: one stdout lock acquisition per turn
+        # instead of one per line
+        buf = io.StringIO()
+        if description:
+            buf.write(f"\n💭 {description}\n")
 
-                    # Color code by agent
-                    if "LEAD" in callsign:
-                        color = "green"
-                    elif "ONE" in callsign:
-                        color = "blue"
-                    elif "TWO" in callsign:
-                        color = "cyan"
-                    else:
-                        color = "blue"
+        self.print_message("COMMAND", message, "yellow", out=buf)
 
-                    self.print_message(callsign, response.content, color)
+        if turn_result["agent_responses"]:
+            buf.write("\n")
+            for response in turn_result["agent_responses"]:
+                self.metrics["responses"] += 1
+                callsign = response.sender_callsign or response.sender_id
 
-                print(f"\n⏱️  Response time: {elapsed:.2f}s")
-            else:
-                print("\n⚠️  No agent responses")
+                # Color code by agent
+                if "LEAD" in callsign:
+                    color = "green"
+                elif "ONE" in callsign:
+                    color = "blue"
+                elif "TWO" in callsign:
+                    color = "cyan"
+                else:
+                    color = "blue"
+
+                self.print_message(callsign, response.content, color, out=buf)
+
+            buf.write(f"\n⏱️  Response time: {elapsed_ns / 1e9:.2f}s\n")
+        else:
+            buf.write("\n⚠️  No agent responses\n")
 
-        except asyncio.TimeoutError:
-            print("\n❌ Response timeout (45s)")
+        async with self._print_lock:
+            sys.stdout.write(buf.getvalue())
+            sys.stdout.flush()
 
         # Delay before next turn
         if self.delay > 0:
@@ -227,7 +385,7 @@ Keep responses brief (2-3 sentences)."""
 
     async def run_scenario(self):
         """Run the automated scenario."""
-        self.metrics["start_time"] = time.time()
+        self.metrics["start_time"] = time.perf_counter_ns()
 
         self.print_header("SCENARIO: Search and Rescue Mission")
 
@@ -236,7 +394,10 @@ Keep responses brief (2-3 sentences)."""
 
         await asyncio.sleep(1)
 
-        # Define scenario turns
+        # Define scenario turns. Turns 2-4 task different specialists and
+        # have no data dependency on each other, so they run concurrently;
+        # turn 1 (mission activation) must land first, and turns 5-6
+        # (status/coordination) depend on the specialists' answers.
         turns = [
             {
                 "message": "All stations, this is Mission Command, we have a SAR mission. Rescue Lead, take charge and coordinate the team, over.",
@@ -264,12 +425,23 @@ Keep responses brief (2-3 sentences)."""
             }
         ]
 
-        # Execute turns
-        for i, turn in enumerate(turns, 1):
+        # Execute turns: activation first, then the three independent
+        # specialist taskings concurrently (wall time = slowest turn, not
+        # the sum), then the dependent wrap-up turns in order
+        self.print_section(f"Act 1 of {len(turns)}")
+        await self.send_and_display(turns[0]["message"], turns[0]["description"])
+
+        self.print_section(f"Acts 2-4 of {len(turns)} (concurrent specialist taskings)")
+        await asyncio.gather(*[
+            self.send_and_display(turn["message"], turn["description"])
+            for turn in turns[1:4]
+        ])
+
+        for i, turn in enumerate(turns[4:], 5):
             self.print_section(f"Act {i} of {len(turns)}")
             await self.send_and_display(turn["message"], turn["description"])
 
-        self.metrics["end_time"] = time.time()
+        self.metrics["end_time"] = time.perf_counter_ns()
 
     def show_team_memory(self):
         """Display agent memory summary."""
@@ -279,23 +451,28 @@ Keep responses brief (2-3 sentences)."""
 
         for agent in agents:
             memory_summary = agent.get_memory_summary()
-            total_items = sum(memory_summary.values())
 
             print(f"\n{agent.callsign}:")
 
-            if total_items > 0:
+            # Only the zero/nonzero distinction matters, so short-circuit
+            # with any() instead of summing every counter
+            if any(memory_summary.values()):
                 print(f"  📊 Memory: {memory_summary['tasks']} tasks, "
                       f"{memory_summary['facts']} facts, "
                       f"{memory_summary['concerns']} concerns")
 
-                if agent.memory.get('task_list')[:2]:
+                # islice takes the first two entries without materializing
+                # the full task list / items view
+                tasks = list(itertools.islice(agent.memory.get('task_list', ()), 2))
+                if tasks:
                     print(f"  Active Tasks:")
-                    for task in agent.memory['task_list'][:2]:
+                    for task in tasks:
                         print(f"    • {task}")
 
-                if list(agent.memory.get('key_facts', {}).items())[:2]:
+                facts = list(itertools.islice(agent.memory.get('key_facts', {}).items(), 2))
+                if facts:
                     print(f"  Key Facts:")
-                    for key, value in list(agent.memory['key_facts'].items())[:2]:
+                    for key, value in facts:
                         print(f"    • {key}: {value}")
             else:
                 print("  (No memory stored)")
@@ -304,7 +481,7 @@ Keep responses brief (2-3 sentences)."""
         """Display demo metrics."""
         self.print_section("Demo Metrics")
 
-        duration = self.metrics["end_time"] - self.metrics["start_time"]
+        duration = (self.metrics["end_time"] - self.metrics["start_time"]) / 1e9
         avg_per_turn = duration / self.metrics["turns"] if self.metrics["turns"] > 0 else 0
 
         print(f"Total Duration: {duration:.2f}s")
@@ -333,7 +510,7 @@ Keep responses brief (2-3 sentences)."""
             agents=agents,
             metadata={
                 "demo_type": "automated",
-                "duration": self.metrics["end_time"] - self.metrics["start_time"],
+                "duration": (self.metrics["end_time"] - self.metrics["start_time"]) / 1e9,
                 "turns": self.metrics["turns"],
                 "responses": self.metrics["responses"]
             }
@@ -401,15 +578,26 @@ async def main():
                        help='Skip metrics display')
     parser.add_argument('--fast', action='store_true',
                        help='Fast mode (no delays)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Disable the response cache (always call the LLM)')
 
     args = parser.parse_args()
 
     delay = 0 if args.fast else args.delay
     show_metrics = not args.no_metrics
 
-    demo = AutomatedDemo(delay_between_turns=delay, show_metrics=show_metrics)
+    demo = AutomatedDemo(delay_between_turns=delay, show_metrics=show_metrics,
+                         use_cache=not args.no_cache)
     await demo.run()
 
 
 if __name__ == "__main__":
+    # uvloop (libuv-based event loop) roughly halves asyncio callback
+    # dispatch overhead; purely optional, stock asyncio is used when absent
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     asyncio.run(main())
@@ -25,8 +25,31 @@ from src.agents.squad_leader import SquadLeaderAgent
 from src.channel.shared_channel import SharedChannel
 from src.orchestration.orchestrator import Orchestrator
 from src.ui.dashboard import create_dashboard
+from src.config import AEROSPACE_MCP_PATH, HAS_MCP
 from src.mcp.mcp_manager import get_mcp_manager, initialize_aerospace_mcp
 
+# aioconsole reads stdin natively on the event loop, avoiding the worker
+# thread (and its ~20KiB stack) that run_in_executor burns per prompt;
+# purely optional, the executor path is used when absent
+try:
+    import aioconsole
+except ImportError:
+    aioconsole = None
+
+
+async def _ainput(prompt: str) -> str:
+    """Read a line of user input without blocking the event loop.
+
+    Args:
+        prompt: Prompt shown before the input cursor
+
+    Returns:
+        The entered line
+    """
+    if aioconsole is not None:
+        return await aioconsole.ainput(prompt)
+    return await asyncio.get_event_loop().run_in_executor(None, input, prompt)
+
 
 class DashboardDemo:
     """Runs the dashboard demonstration."""
@@ -36,25 +59,27 @@ class DashboardDemo:
         self.orchestrator = None
         self.console = Console()
         self.live = None
+        # Set by setup_mission; cleanup checks this instead of re-statting
+        # the aerospace-mcp path
+        self._has_mcp = False
 
     async def setup_mission(self):
         """Set up the multi-agent mission."""
         self.console.print("\n[bold cyan]🚁 Initializing Multi-Agent System...[/bold cyan]\n")
 
         # Initialize MCP if available
-        base_path = Path(__file__).parent.parent
-        aerospace_path = str(base_path / "aerospace-mcp")
-
         mcp_manager = None
-        if Path(aerospace_path).exists():
+        if HAS_MCP:
             self.console.print("🔧 Connecting to aerospace-mcp...")
-            await initialize_aerospace_mcp(aerospace_path)
+            await initialize_aerospace_mcp(str(AEROSPACE_MCP_PATH))
             mcp_manager = await get_mcp_manager()
             tools = mcp_manager.get_available_tools()
             self.console.print(f"✅ {len(tools)} aviation tools available\n")
         else:
             self.console.print("⚠️  No MCP servers found (optional)\n")
 
+        self._has_mcp = mcp_manager is not None
+
         # Create agents
         squad_leader = SquadLeaderAgent(
             agent_id="leader",
@@ -95,8 +120,9 @@ class DashboardDemo:
         agents = self.orchestrator.get_active_agents()
         self.dashboard = create_dashboard(agents)
 
-        # Add initial system message
-        self.dashboard.add_message(channel.messages[0])  # "Collaboration session started"
+        # Add initial system message ("Collaboration session started")
+        # without assuming which container backs the channel history
+        self.dashboard.add_message(next(iter(channel.messages)))
 
         self.console.print("[bold green]✅ System Ready![/bold green]")
         self.console.print("[dim]Starting live dashboard...[/dim]\n")
@@ -141,17 +167,15 @@ class DashboardDemo:
                 max_agent_responses=3
             )
 
-            # Add messages to dashboard
-            if turn_result["user_message"]:
-                self.dashboard.add_message(turn_result["user_message"])
-
-            for response in turn_result["agent_responses"]:
-                self.dashboard.add_message(response)
-
-            # Update dashboard
-            self.dashboard.update()
+            # Add the whole turn to the dashboard in one append, then
+            # redraw once
+            self.dashboard.add_messages([
+                msg for msg in
+                (turn_result["user_message"], *turn_result["agent_responses"])
+                if msg
+            ])
 
-            # Pause
+            # Pause (the refresh loop repaints once the new messages land)
             await asyncio.sleep(step["pause"])
 
     async def run_interactive(self):
@@ -162,10 +186,9 @@ class DashboardDemo:
 
         while True:
             try:
-                # Get user input (note: this will pause the live display)
-                message = await asyncio.get_event_loop().run_in_executor(
-                    None, input, "Your message: "
-                )
+                # Get user input; with aioconsole this stays on the event
+                # loop so the live display keeps refreshing while waiting
+                message = await _ainput("Your message: ")
 
                 if message.strip():
                     # Process message
@@ -174,35 +197,55 @@ class DashboardDemo:
                         max_agent_responses=3
                     )
 
-                    # Add to dashboard
-                    if turn_result["user_message"]:
-                        self.dashboard.add_message(turn_result["user_message"])
-
-                    for response in turn_result["agent_responses"]:
-                        self.dashboard.add_message(response)
-
-                    # Update
-                    self.dashboard.update()
+                    # Add the whole turn in one append; the refresh loop
+                    # repaints once the new messages land
+                    self.dashboard.add_messages([
+                        msg for msg in
+                        (turn_result["user_message"], *turn_result["agent_responses"])
+                        if msg
+                    ])
 
             except EOFError:
                 break
 
+    async def _refresh_loop(self, live: Live, interval: float = 0.25):
+        """Repaint the live view only when the dashboard content changed.
+
+        Replaces a fixed 4 Hz refresh timer: during the long inter-turn
+        pauses nothing is redrawn at all, and new messages appear within
+        one polling interval.
+
+        Args:
+            live: Active rich Live context
+            interval: Dirty-flag polling interval in seconds
+        """
+        while True:
+            await asyncio.sleep(interval)
+            if self.dashboard.poll_dirty():
+                self.dashboard.update()
+                live.refresh()
+
     async def run(self, mode: str = "auto"):
         """Run the dashboard demo.
 
         Args:
             mode: 'auto' for automated demo, 'interactive' for user input
         """
+        refresher = None
         try:
             # Setup
             await self.setup_mission()
 
-            # Start live dashboard
-            with Live(self.dashboard.layout, refresh_per_second=4, console=self.console) as live:
+            # Start live dashboard; redraws are driven by the dirty flag
+            # instead of a fixed refresh rate
+            with Live(self.dashboard.layout, auto_refresh=False, console=self.console) as live:
                 self.live = live
 
                 # Initial update
                 self.dashboard.update()
+                live.refresh()
+
+                refresher = asyncio.create_task(self._refresh_loop(live))
 
                 if mode == "auto":
                     # Run automated sequence
@@ -216,7 +259,6 @@ class DashboardDemo:
                     try:
                         while True:
                             await asyncio.sleep(1)
-                            self.dashboard.update()
                     except KeyboardInterrupt:
                         pass
 
@@ -234,10 +276,12 @@ class DashboardDemo:
 
         finally:
             # Cleanup
-            if self.orchestrator:
-                mcp_manager = await get_mcp_manager() if Path(str(Path(__file__).parent.parent / "aerospace-mcp")).exists() else None
-                if mcp_manager:
-                    await mcp_manager.cleanup()
+            if refresher:
+                refresher.cancel()
+
+            if self.orchestrator and self._has_mcp:
+                mcp_manager = await get_mcp_manager()
+                await mcp_manager.cleanup()
 
             self.console.print("\n[dim]Thanks for trying the dashboard demo![/dim]")
 
@@ -272,4 +316,12 @@ async def main():
 
 
 if __name__ == "__main__":
+    # uvloop (libuv-based event loop) roughly halves asyncio callback
+    # dispatch overhead; purely optional, stock asyncio is used when absent
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     asyncio.run(main())
@@ -13,19 +13,56 @@ Scenario: Coast Guard Search and Rescue Mission Planning
 """
 
 import asyncio
+import os
 import sys
 from pathlib import Path
 from datetime import datetime
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent))
-
-from src.agents.base_agent import BaseAgent
-from src.agents.squad_leader import SquadLeaderAgent
-from src.channel.shared_channel import SharedChannel
-from src.orchestration.orchestrator import Orchestrator
-from src.mcp.mcp_manager import get_mcp_manager, initialize_aerospace_mcp
-from src.state.state_manager import StateManager
+# aioconsole reads stdin natively on the event loop; purely optional,
+# a worker thread is used when absent
+try:
+    import aioconsole
+except ImportError:
+    aioconsole = None
+
+
+async def _ainput(prompt: str) -> str:
+    """Read a line of user input without blocking the event loop.
+
+    Args:
+        prompt: Prompt shown before the input cursor
+
+    Returns:
+        The entered line
+    """
+    if aioconsole is not None:
+        return await aioconsole.ainput(prompt)
+    return await asyncio.to_thread(input, prompt)
+
+
+# Separator lines, built once instead of per header/section call
+_WIDTH = 80
+_EQ_LINE = "=" * _WIDTH
+_DASH_LINE = "─" * _WIDTH
+_SUB_LINE = "-" * 60
+
+# ANSI color codes, built once instead of per printed message
+_COLORS = {
+    "blue": "\033[94m",
+    "green": "\033[92m",
+    "yellow": "\033[93m",
+    "red": "\033[91m",
+}
+_COLOR_END = "\033[0m"
+
+# Scenario menu, formatted once instead of five prints per loop pass
+_MENU = (
+    "\nOptions:\n"
+    "  1. Send a message to the team\n"
+    "  2. View team memory/context\n"
+    "  3. Continue to next act\n"
+    "  4. Save session and exit\n"
+)
 
 
 class DemoRunner:
@@ -35,38 +72,57 @@ class DemoRunner:
         self.orchestrator = None
         self.state_manager = None
         self.mcp_manager = None
+        self.session_id = None
+        # Callsign -> ANSI-wrapped display prefix, baked once in setup()
+        self._display_prefixes = {}
+        # Menu choice -> handler coroutine; acts 3 and 4 stay inline in
+        # run_scenario because they drive its control flow
+        self._menu_handlers = {
+            "1": self._opt_send_message,
+            "2": self._opt_team_status,
+        }
+        # Roster snapshot taken once after setup; the demo never adds or
+        # removes agents, so repeated get_active_agents() list builds in
+        # the menu loop are avoided
+        self._agents_cache = None
 
     def print_header(self, text: str, char: str = "="):
         """Print a formatted header."""
-        width = 80
-        print("\n" + char * width)
-        print(text.center(width))
-        print(char * width + "\n")
+        line = _EQ_LINE if char == "=" else char * _WIDTH
+        sys.stdout.write(f"\n{line}\n{text.center(_WIDTH)}\n{line}\n\n")
 
     def print_message(self, sender: str, content: str, color: str = ""):
         """Print a formatted message."""
-        colors = {
-            "blue": "\033[94m",
-            "green": "\033[92m",
-            "yellow": "\033[93m",
-            "red": "\033[91m",
-            "end": "\033[0m"
-        }
-
-        if color and color in colors:
-            print(f"{colors[color]}[{sender}]: {content}{colors['end']}")
+        if color and color in _COLORS:
+            sys.stdout.write(f"{_COLORS[color]}[{sender}]: {content}{_COLOR_END}\n\n")
         else:
-            print(f"[{sender}]: {content}")
-        print()
+            sys.stdout.write(f"[{sender}]: {content}\n\n")
 
     def print_section(self, title: str):
         """Print a section header."""
-        print("\n" + "─" * 80)
-        print(f"  {title}")
-        print("─" * 80 + "\n")
+        sys.stdout.write(f"\n{_DASH_LINE}\n  {title}\n{_DASH_LINE}\n\n")
 
     async def setup(self):
         """Initialize the demo environment."""
+        # Fail fast before spawning the MCP subprocess and four agents;
+        # without this a missing key only surfaces inside the first turn
+        if not os.environ.get("ANTHROPIC_API_KEY"):
+            print("ERROR: ANTHROPIC_API_KEY environment variable not set")
+            print("Please set your Anthropic API key:")
+            print("  export ANTHROPIC_API_KEY='your-key-here'")
+            sys.exit(1)
+
+        # Deferred to first use: these pull in the Anthropic SDK and the
+        # MCP stack, so the banner appears immediately instead of after
+        # the heavy imports resolve
+        from src.agents.base_agent import BaseAgent
+        from src.agents.squad_leader import SquadLeaderAgent
+        from src.channel.shared_channel import SharedChannel
+        from src.orchestration.orchestrator import Orchestrator
+        from src.mcp.mcp_manager import get_mcp_manager, initialize_aerospace_mcp
+        from src.mcp.tool_scheduler import ToolScheduler
+        from src.state.state_manager import StateManager
+
         self.print_header("🚁 MULTI-AGENT AVIATION DEMO 🚁")
 
         print("Scenario: Coast Guard Search and Rescue Mission Planning")
@@ -84,7 +140,10 @@ class DemoRunner:
         if Path(aerospace_path).exists():
             print("🔧 Connecting to aerospace-mcp server...")
             await initialize_aerospace_mcp(aerospace_path)
-            self.mcp_manager = await get_mcp_manager()
+            # All four agents share the manager; the scheduler bounds
+            # in-flight calls per server so a burst of tool use from the
+            # team queues instead of saturating the stdio session
+            self.mcp_manager = ToolScheduler(await get_mcp_manager())
 
             tools = self.mcp_manager.get_available_tools()
             print(f"✅ Connected! {len(tools)} aviation tools available")
@@ -156,10 +215,25 @@ Track weather changes and concerns."""
         self.orchestrator.add_agent(navigator)
         self.orchestrator.add_agent(weather_officer)
         self.orchestrator.start()
+        self._agents_cache = self.orchestrator.get_active_agents()
+
+        # The display color is deterministic per agent (green for the
+        # lead, blue for specialists); bake the full prefix up front
+        # instead of re-deciding it for every response
+        self._display_prefixes = {
+            agent.callsign:
+                f"{_COLORS['green'] if 'LEAD' in agent.callsign else _COLORS['blue']}"
+                f"[{agent.callsign}]: "
+            for agent in self._agents_cache
+        }
 
-        # Initialize state manager
+        # Initialize state manager; messages stream into the incremental
+        # log as they arrive, so the exit-time save only finalizes the
+        # session snapshot instead of being the sole point of durability
         self.state_manager = StateManager()
         await self.state_manager.initialize_db()
+        self.session_id = f"sar-mission-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+        self.state_manager.start_autosave(self.session_id, channel)
 
         print("✅ Team assembled and ready for tasking")
         print()
@@ -203,8 +277,7 @@ Track weather changes and concerns."""
 
         for act_num, act in enumerate(acts, 1):
             self.print_header(f"{act['title']}", "=")
-            print(act['description'])
-            print()
+            sys.stdout.write(f"{act['description']}\n\n")
 
             for prompt_type, prompt_text in act['prompts']:
                 if prompt_type == "Commander":
@@ -213,35 +286,37 @@ Track weather changes and concerns."""
                     await self.send_and_display(prompt_text)
                 else:
                     # Show as suggestion
-                    print(f"💡 {prompt_text}")
-                    print()
+                    sys.stdout.write(f"💡 {prompt_text}\n\n")
 
             # Interactive prompt
             while True:
-                print("\nOptions:")
-                print("  1. Send a message to the team")
-                print("  2. View team memory/context")
-                print("  3. Continue to next act")
-                print("  4. Save session and exit")
-
-                choice = input("\nYour choice (1-4): ").strip()
-
-                if choice == "1":
-                    message = input("\n📡 Your message: ").strip()
-                    if message:
-                        await self.send_and_display(message)
-                elif choice == "2":
-                    self.show_team_status()
-                elif choice == "3":
+                sys.stdout.write(_MENU)
+                choice = (await _ainput("\nYour choice (1-4): ")).strip()
+
+                if choice == "3":
                     break
-                elif choice == "4":
+                if choice == "4":
                     await self.save_and_exit()
                     return False
+
+                handler = self._menu_handlers.get(choice)
+                if handler:
+                    await handler()
                 else:
                     print("Invalid choice. Please enter 1-4.")
 
         return True
 
+    async def _opt_send_message(self):
+        """Menu option 1: prompt for a message and send it to the team."""
+        message = (await _ainput("\n📡 Your message: ")).strip()
+        if message:
+            await self.send_and_display(message)
+
+    async def _opt_team_status(self):
+        """Menu option 2: show team memory and status."""
+        self.show_team_status()
+
     async def send_and_display(self, message: str):
         """Send message and display responses."""
         print()
@@ -255,10 +330,11 @@ Track weather changes and concerns."""
             for response in turn_result["agent_responses"]:
                 callsign = response.sender_callsign or response.sender_id
 
-                # Color code by agent type
-                color = "green" if "LEAD" in callsign else "blue"
-
-                self.print_message(callsign, response.content, color)
+                prefix = self._display_prefixes.get(callsign)
+                if prefix:
+                    sys.stdout.write(f"{prefix}{response.content}{_COLOR_END}\n\n")
+                else:
+                    self.print_message(callsign, response.content, "blue")
         else:
             print("⚠️  No response received")
             print()
@@ -267,41 +343,49 @@ Track weather changes and concerns."""
         """Display agent memory and status."""
         self.print_section("Team Status & Memory")
 
-        agents = self.orchestrator.get_active_agents()
+        agents = self._agents_cache
 
+        # Accumulate the whole status view and write it in one go rather
+        # than one syscall per line
+        buf = []
         for agent in agents:
-            print(f"\n{agent.callsign}:")
-            print("-" * 60)
+            buf.append(f"\n{agent.callsign}:\n")
+            buf.append(_SUB_LINE + "\n")
 
             memory_summary = agent.get_memory_summary()
             total_items = sum(memory_summary.values())
 
             if total_items > 0:
-                print(f"  Memory: {memory_summary['tasks']} tasks, {memory_summary['facts']} facts, "
-                      f"{memory_summary['concerns']} concerns")
+                buf.append(f"  Memory: {memory_summary['tasks']} tasks, {memory_summary['facts']} facts, "
+                           f"{memory_summary['concerns']} concerns\n")
 
                 # Show memory details
                 if agent.memory.get('task_list'):
-                    print(f"  Active Tasks:")
+                    buf.append("  Active Tasks:\n")
                     for task in agent.memory['task_list'][:3]:
-                        print(f"    • {task}")
+                        buf.append(f"    • {task}\n")
 
                 if agent.memory.get('key_facts'):
-                    print(f"  Key Facts:")
+                    buf.append("  Key Facts:\n")
                     for key, value in list(agent.memory['key_facts'].items())[:3]:
-                        print(f"    • {key}: {value}")
+                        buf.append(f"    • {key}: {value}\n")
             else:
-                print("  (No memory stored yet)")
+                buf.append("  (No memory stored yet)\n")
 
-        print()
+        buf.append("\n")
+        sys.stdout.write("".join(buf))
 
     async def save_and_exit(self):
         """Save session and exit."""
         self.print_section("Saving Mission Data")
 
-        session_id = f"sar-mission-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+        session_id = self.session_id
 
-        agents = self.orchestrator.get_active_agents()
+        # Messages are already in the incremental log; stop streaming and
+        # write the final session snapshot
+        await self.state_manager.stop_autosave()
+
+        agents = self._agents_cache
         success = await self.state_manager.save_session(
             session_id=session_id,
             channel=self.orchestrator.channel,
@@ -332,39 +416,40 @@ Track weather changes and concerns."""
         try:
             await self.setup()
 
-            print("\n" + "=" * 80)
-            print("DEMO READY - You can now interact with your team!")
-            print("=" * 80)
-            print()
-            print("Tips:")
-            print("  • Use callsigns for directed communication: 'Alpha One, [task]'")
-            print("  • Use 'All stations' for broadcasts")
-            print("  • Squad leader will delegate if asked")
-            print("  • Agents use real aviation tools when available")
-            print("  • Agent memory persists across the session")
-            print()
+            sys.stdout.write(
+                f"\n{_EQ_LINE}\n"
+                "DEMO READY - You can now interact with your team!\n"
+                f"{_EQ_LINE}\n\n"
+                "Tips:\n"
+                "  • Use callsigns for directed communication: 'Alpha One, [task]'\n"
+                "  • Use 'All stations' for broadcasts\n"
+                "  • Squad leader will delegate if asked\n"
+                "  • Agents use real aviation tools when available\n"
+                "  • Agent memory persists across the session\n\n"
+            )
 
-            input("Press Enter to begin the mission...")
+            await _ainput("Press Enter to begin the mission...")
 
             completed = await self.run_scenario()
 
             if completed:
                 self.print_header("🎉 DEMO COMPLETE 🎉")
-                print("Key Features Demonstrated:")
-                print("  ✅ Autonomous tool use (agents used real aviation data)")
-                print("  ✅ Directed communication (agents responded only when addressed)")
-                print("  ✅ Squad leader delegation (coordinated the team)")
-                print("  ✅ Agent memory (agents remembered important information)")
-                print("  ✅ Voice net protocol (professional aviation communication)")
-                print()
-
-                save_choice = input("Would you like to save this session? (y/n): ").strip().lower()
+                sys.stdout.write(
+                    "Key Features Demonstrated:\n"
+                    "  ✅ Autonomous tool use (agents used real aviation data)\n"
+                    "  ✅ Directed communication (agents responded only when addressed)\n"
+                    "  ✅ Squad leader delegation (coordinated the team)\n"
+                    "  ✅ Agent memory (agents remembered important information)\n"
+                    "  ✅ Voice net protocol (professional aviation communication)\n\n"
+                )
+
+                save_choice = (await _ainput("Would you like to save this session? (y/n): ")).strip().lower()
                 if save_choice == 'y':
                     await self.save_and_exit()
 
         except KeyboardInterrupt:
             print("\n\n⚠️  Demo interrupted")
-            save_choice = input("Save session before exiting? (y/n): ").strip().lower()
+            save_choice = (await _ainput("Save session before exiting? (y/n): ")).strip().lower()
             if save_choice == 'y':
                 await self.save_and_exit()
 
@@ -374,7 +459,10 @@ Track weather changes and concerns."""
             traceback.print_exc()
 
         finally:
-            # Cleanup
+            # Cleanup; flushes any messages the autosave task hasn't
+            # persisted yet (no-op if save_and_exit already stopped it)
+            if self.state_manager:
+                await self.state_manager.stop_autosave()
             if self.mcp_manager:
                 await self.mcp_manager.cleanup()
             print("\n👋 Thanks for trying the multi-agent demo!")
@@ -387,4 +475,12 @@ async def main():
 
 
 if __name__ == "__main__":
+    # uvloop (libuv-based event loop) roughly halves asyncio callback
+    # dispatch overhead; purely optional, stock asyncio is used when absent
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     asyncio.run(main())
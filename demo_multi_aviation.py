@@ -18,15 +18,6 @@ import os
 import sys
 import asyncio
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
-
-from src.agents.squad_leader import SquadLeaderAgent
-from src.agents.aerospace_agent import AerospaceAgent
-from src.channel.shared_channel import SharedChannel
-from src.orchestration.orchestrator import Orchestrator
-from src.mcp.mcp_manager import initialize_all_aviation_mcps, get_mcp_manager
-
 
 def print_separator(title=""):
     """Print a visual separator."""
@@ -50,25 +41,35 @@ async def main():
         print("  export ANTHROPIC_API_KEY='your-key-here'")
         sys.exit(1)
 
+    # Deferred past the API-key guard: these pull in the Anthropic SDK
+    # and the MCP stack (anyio, JSON-RPC), which is wasted work when the
+    # run aborts at the check above
+    from src.agents.squad_leader import SquadLeaderAgent
+    from src.agents.aerospace_agent import AerospaceAgent
+    from src.channel.shared_channel import SharedChannel
+    from src.orchestration.orchestrator import Orchestrator
+    from src.mcp.mcp_manager import initialize_all_aviation_mcps, get_mcp_manager
+
     print("Initializing multi-agent aerospace system...")
     print("Connecting to Aviation MCP servers...\n")
 
     # Get parent directory for MCP servers
     parent_dir = os.path.dirname(os.path.dirname(__file__))
 
-    # Define server paths
-    aerospace_path = os.path.join(parent_dir, "aerospace-mcp")
-    aviation_weather_path = os.path.join(parent_dir, "aviation-weather-mcp")
-    blevinstein_aviation_path = os.path.join(parent_dir, "aviation-mcp")
+    # Check which server checkouts exist with one directory scan instead
+    # of a stat() per candidate path
+    try:
+        present = {entry.name for entry in os.scandir(parent_dir) if entry.is_dir()}
+    except FileNotFoundError:
+        present = set()
 
-    # Check which servers exist
     servers_to_connect = {}
-    if os.path.exists(aerospace_path):
-        servers_to_connect["aerospace_path"] = aerospace_path
-    if os.path.exists(aviation_weather_path):
-        servers_to_connect["aviation_weather_path"] = aviation_weather_path
-    if os.path.exists(blevinstein_aviation_path):
-        servers_to_connect["blevinstein_aviation_path"] = blevinstein_aviation_path
+    if "aerospace-mcp" in present:
+        servers_to_connect["aerospace_path"] = os.path.join(parent_dir, "aerospace-mcp")
+    if "aviation-weather-mcp" in present:
+        servers_to_connect["aviation_weather_path"] = os.path.join(parent_dir, "aviation-weather-mcp")
+    if "aviation-mcp" in present:
+        servers_to_connect["blevinstein_aviation_path"] = os.path.join(parent_dir, "aviation-mcp")
 
     if not servers_to_connect:
         print("❌ No MCP servers found")
@@ -129,16 +130,23 @@ async def main():
     print("User requests comprehensive flight planning with weather check.")
     print("Expected: Agent uses aerospace-mcp for planning\n")
 
-    user_msg = "Hawk One, plan a flight from San Francisco (SFO) to Los Angeles (LAX). Also check current weather at both airports."
-    print(f"[USER] {user_msg}\n")
-
-    orchestrator.run_turn(user_message=user_msg)
+    scenario1_msg = "Hawk One, plan a flight from San Francisco (SFO) to Los Angeles (LAX). Also check current weather at both airports."
+    scenario3_msg = "I need a complete pre-flight briefing for a flight from Chicago O'Hare (KORD) to Denver (KDEN). Include route, weather, and any performance considerations."
+    print(f"[USER] {scenario1_msg}\n")
+
+    # Scenarios 1 and 3 have no data dependency on each other, so their
+    # turns run concurrently and wall time is the slower of the two LLM
+    # round-trips instead of the sum. Each transcript is rendered from
+    # its own turn result, so interleaving in the channel doesn't mix
+    # the displayed output.
+    scenario1_result, scenario3_result = await asyncio.gather(
+        orchestrator.run_turn(user_message=scenario1_msg),
+        orchestrator.run_turn(user_message=scenario3_msg, max_agent_responses=2),
+    )
 
     # Show responses
-    recent = channel.get_recent_messages(5)
-    for msg in recent:
-        if msg.sender_id not in ["user", "system"]:
-            print(f"[{msg.sender_callsign}] {msg.content}\n")
+    for msg in scenario1_result["agent_responses"]:
+        print(f"[{msg.sender_callsign}] {msg.content}\n")
 
     input("Press Enter to continue to next scenario...")
 
@@ -151,31 +159,26 @@ async def main():
         user_msg = "Get me the current METAR and TAF for John F. Kennedy International (KJFK)."
         print(f"[USER] {user_msg}\n")
 
-        orchestrator.run_turn(user_message=user_msg)
+        await orchestrator.run_turn(user_message=user_msg)
 
         # Show responses
-        recent = channel.get_recent_messages(5)
-        for msg in recent[-3:]:
-            if msg.sender_id not in ["user", "system"]:
-                print(f"[{msg.sender_callsign}] {msg.content}\n")
+        for sender_id, callsign, content in channel.get_recent_projection(3):
+            if sender_id not in ("user", "system"):
+                print(f"[{callsign}] {content}\n")
 
         input("Press Enter to continue to next scenario...")
 
-    # Scenario 3: Complex mission coordination
+    # Scenario 3: Complex mission coordination (turn already completed
+    # alongside scenario 1 above; render its transcript here)
     print_separator("SCENARIO 3: Multi-Tool Mission Analysis")
     print("User asks for comprehensive pre-flight briefing.")
     print("Expected: Agent coordinates multiple MCP tools\n")
 
-    user_msg = "I need a complete pre-flight briefing for a flight from Chicago O'Hare (KORD) to Denver (KDEN). Include route, weather, and any performance considerations."
-    print(f"[USER] {user_msg}\n")
-
-    orchestrator.run_turn(user_message=user_msg, max_agent_responses=2)
+    print(f"[USER] {scenario3_msg}\n")
 
     # Show responses
-    recent = channel.get_recent_messages(8)
-    for msg in recent[-5:]:
-        if msg.sender_id not in ["user", "system"]:
-            print(f"[{msg.sender_callsign}] {msg.content}\n")
+    for msg in scenario3_result["agent_responses"]:
+        print(f"[{msg.sender_callsign}] {msg.content}\n")
 
     input("Press Enter to continue to next scenario...")
 
@@ -187,13 +190,12 @@ async def main():
     user_msg = "What aviation analysis capabilities are available?"
     print(f"[USER] {user_msg}\n")
 
-    orchestrator.run_turn(user_message=user_msg, max_agent_responses=2)
+    await orchestrator.run_turn(user_message=user_msg, max_agent_responses=2)
 
     # Show responses
-    recent = channel.get_recent_messages(5)
-    for msg in recent[-4:]:
-        if msg.sender_id not in ["user", "system"]:
-            print(f"[{msg.sender_callsign}] {msg.content}\n")
+    for sender_id, callsign, content in channel.get_recent_projection(4):
+        if sender_id not in ("user", "system"):
+            print(f"[{callsign}] {content}\n")
 
     # Show full conversation history
     print_separator("FULL MISSION TRANSCRIPT")
@@ -229,4 +231,12 @@ async def main():
 
 
 if __name__ == "__main__":
+    # uvloop (libuv-based event loop) roughly halves asyncio callback
+    # dispatch overhead; purely optional, stock asyncio is used when absent
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     asyncio.run(main())
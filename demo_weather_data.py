@@ -16,30 +16,84 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from src.mcp.mcp_manager import get_mcp_manager
+from src.utils.concurrency import gather_bounded
+
+# Substrings identifying weather-related tools, defined once rather
+# than rebuilt inside the filtering comprehension
+_WEATHER_KEYWORDS = ('metar', 'taf', 'weather', 'wind', 'pirep')
+
+# Separator row built once at import instead of per header
+_HEADER_BAR = "=" * 80
 
 
 def print_header(title: str):
     """Print a formatted header."""
-    print("\n" + "=" * 80)
-    print(title.center(80))
-    print("=" * 80 + "\n")
+    print(f"\n{_HEADER_BAR}\n{title.center(80)}\n{_HEADER_BAR}\n")
+
+
+def print_tool_result(result):
+    """Print a tool result, or the exception that replaced it.
+
+    Args:
+        result: Tool result object, or an Exception captured by
+            asyncio.gather(return_exceptions=True)
+    """
+    if isinstance(result, Exception):
+        print(f"❌ Error: {result}")
+    elif result and hasattr(result, 'content') and result.content:
+        print("📊 Result:")
+        print("-" * 80)
+        print(result.content[0].text)
+        print("-" * 80)
+    else:
+        print("❌ No result returned")
+
+
+async def batch_metar(manager, ids):
+    """Fetch METARs for several stations with one tool call.
+
+    aviationweather.gov accepts comma-separated station IDs, so N
+    stations cost a single JSON-RPC round-trip instead of one per
+    station.
+
+    Args:
+        manager: Connected MCP manager
+        ids: Iterable of ICAO station identifiers
+
+    Returns:
+        Dict mapping each station ID to its report lines (empty list if
+        the response contained none for that station)
+    """
+    stations = list(ids)
+    # METARs refresh roughly once a minute upstream; cache accordingly
+    result = await manager.call_tool_cached(
+        server_name="aviation-mcp",
+        tool_name="get_metar",
+        arguments={"ids": ",".join(stations)},
+        ttl_seconds=60
+    )
+
+    reports = {station: [] for station in stations}
+    if result and hasattr(result, 'content') and result.content:
+        for line in result.content[0].text.splitlines():
+            # Raw METAR lines start with the ICAO code, optionally
+            # prefixed by the report type (e.g. "METAR KSFO ...")
+            tokens = line.split()
+            station = next((t for t in tokens[:2] if t in reports), None)
+            if station:
+                reports[station].append(line)
+    return reports
 
 
 async def demo_weather_tools():
     """Demonstrate aviation weather tools."""
-    
-    print_header("AVIATION WEATHER DATA DEMONSTRATION")
-    
-    print("This demo shows how to get real aviation weather data using the")
-    print("aviation-mcp server (by Brian Levinstein).\n")
-    
-    # Initialize MCP manager
-    print("🔧 Connecting to aviation-mcp server...")
-    
+
+    # Kick off the server connect first: npx resolution plus Node
+    # startup dominates this demo's latency, so let it run while the
+    # preamble below is printed and only block right before the first
+    # tool call needs the session
     manager = await get_mcp_manager()
-    
-    # Connect to aviation-mcp
-    success = await manager.connect_server(
+    connect_task = asyncio.create_task(manager.connect_server(
         server_name="aviation-mcp",
         command="npx",
         args=["-y", "aviation-mcp"],
@@ -48,8 +102,17 @@ async def demo_weather_tools():
             "FAA_CLIENT_SECRET": "",
             "API_NINJAS_KEY": ""
         }
-    )
-    
+    ))
+
+    print_header("AVIATION WEATHER DATA DEMONSTRATION")
+
+    print("This demo shows how to get real aviation weather data using the")
+    print("aviation-mcp server (by Brian Levinstein).\n")
+
+    print("🔧 Connecting to aviation-mcp server...")
+
+    success = await connect_task
+
     if not success:
         print("❌ Failed to connect to aviation-mcp server")
         print("   Make sure Node.js and npx are installed")
@@ -59,140 +122,128 @@ async def demo_weather_tools():
     
     # List available weather tools
     tools = manager.get_available_tools("aviation-mcp")
-    weather_tools = [t for t in tools if any(keyword in t['name'].lower() 
-                     for keyword in ['metar', 'taf', 'weather', 'wind', 'pirep'])]
+    weather_tools = [t for t in tools if any(keyword in t['name'].lower()
+                     for keyword in _WEATHER_KEYWORDS)]
     
     print(f"📋 Found {len(weather_tools)} weather-related tools:")
     for tool in weather_tools:
         print(f"  • {tool['name']}: {tool['description'][:60]}...")
     print()
     
-    # Demo 1: Get METAR for San Francisco
-    print_header("Example 1: Get METAR for San Francisco (KSFO)")
-
-    print("METAR = Meteorological Aerodrome Report (current weather)")
-    print("🔍 Calling: get_metar(ids='KSFO')\n")
-    print("Note: aviation-mcp uses 'ids' parameter, not 'stationString'\n")
-
+    # Teardown is deterministic: the server subprocess is closed on
+    # every exit path, not just the happy one
     try:
-        result = await manager.call_tool(
-            server_name="aviation-mcp",
-            tool_name="get_metar",
-            arguments={"ids": "KSFO"}  # Correct parameter name
+        # The three example calls are independent, so fan them out and let
+        # the round-trips overlap: the demo waits for the slowest response
+        # instead of the sum of all three. gather_bounded caps in-flight
+        # calls, so this pattern stays polite to aviationweather.gov even
+        # when the list grows to dozens of airports. return_exceptions
+        # keeps one failing tool from hiding the other results.
+        metar_result, taf_result, station_result = await gather_bounded(
+            [
+                batch_metar(manager, ("KSFO", "KLAX")),
+                manager.call_tool_cached(
+                    server_name="aviation-mcp",
+                    tool_name="get_taf",
+                    arguments={"ids": "KLAX"},
+                    ttl_seconds=600  # TAFs are issued every few hours
+                ),
+                manager.call_tool_cached(
+                    server_name="aviation-mcp",
+                    tool_name="get_station_info",
+                    arguments={"ids": "KSFO"},
+                    ttl_seconds=86400  # station metadata is effectively static
+                ),
+            ],
+            limit=8,
+            return_exceptions=True
         )
-        
-        if result and hasattr(result, 'content') and result.content:
-            response_text = result.content[0].text
-            print("📊 Result:")
-            print("-" * 80)
-            print(response_text)
-            print("-" * 80)
-        else:
-            print("❌ No result returned")
-            
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        print("   Note: This tool may require specific argument format")
-    
-    # Demo 2: Get TAF for Los Angeles
-    print_header("Example 2: Get TAF for Los Angeles (KLAX)")
 
-    print("TAF = Terminal Aerodrome Forecast (weather forecast)")
-    print("🔍 Calling: get_taf(ids='KLAX')\n")
+        # Demo 1: Get METARs for San Francisco and Los Angeles in one call
+        print_header("Example 1: Batched METARs for KSFO and KLAX")
 
-    try:
-        result = await manager.call_tool(
-            server_name="aviation-mcp",
-            tool_name="get_taf",
-            arguments={"ids": "KLAX"}  # Correct parameter name
-        )
-        
-        if result and hasattr(result, 'content') and result.content:
-            response_text = result.content[0].text
+        print("METAR = Meteorological Aerodrome Report (current weather)")
+        print("🔍 Called: get_metar(ids='KSFO,KLAX') — one round-trip for both stations\n")
+        print("Note: aviation-mcp uses 'ids' parameter, not 'stationString'\n")
+
+        if isinstance(metar_result, Exception):
+            print(f"❌ Error: {metar_result}")
+        else:
             print("📊 Result:")
             print("-" * 80)
-            print(response_text)
+            for station, lines in metar_result.items():
+                if lines:
+                    for line in lines:
+                        print(line)
+                else:
+                    print(f"{station}: no report returned")
             print("-" * 80)
-        else:
-            print("❌ No result returned")
-            
-    except Exception as e:
-        print(f"❌ Error: {e}")
-    
-    # Demo 3: Get station info
-    print_header("Example 3: Get Weather Station Info")
 
-    print("🔍 Calling: get_station_info(ids='KSFO')\n")
+        # Demo 2: Get TAF for Los Angeles
+        print_header("Example 2: Get TAF for Los Angeles (KLAX)")
 
-    try:
-        result = await manager.call_tool(
-            server_name="aviation-mcp",
-            tool_name="get_station_info",
-            arguments={"ids": "KSFO"}  # Correct parameter name
-        )
-        
-        if result and hasattr(result, 'content') and result.content:
-            response_text = result.content[0].text
-            print("📊 Result:")
-            print("-" * 80)
-            print(response_text)
-            print("-" * 80)
-        else:
-            print("❌ No result returned")
-            
-    except Exception as e:
-        print(f"❌ Error: {e}")
+        print("TAF = Terminal Aerodrome Forecast (weather forecast)")
+        print("🔍 Called: get_taf(ids='KLAX')\n")
+
+        print_tool_result(taf_result)
+
+        # Demo 3: Get station info
+        print_header("Example 3: Get Weather Station Info")
+
+        print("🔍 Called: get_station_info(ids='KSFO')\n")
+
+        print_tool_result(station_result)
     
-    # Demo 4: What an agent WOULD do
-    print_header("What an Agent Would Do (If Integration Were Complete)")
+        # Demo 4: What an agent WOULD do
+        print_header("What an Agent Would Do (If Integration Were Complete)")
     
-    print("📝 Hypothetical Scenario:")
-    print("-" * 80)
-    print("USER: 'Alpha One, what's the current weather at San Francisco")
-    print("       International Airport?'\n")
+        print("📝 Hypothetical Scenario:")
+        print("-" * 80)
+        print("USER: 'Alpha One, what's the current weather at San Francisco")
+        print("       International Airport?'\n")
     
-    print("🤖 What the agent WOULD do:")
-    print("-" * 80)
-    print()
-    print("Step 1: Agent receives message and has access to weather tools")
-    print("  • Agent sees user wants weather information")
-    print("  • Agent has access to 'get_metar' tool from aviation-mcp")
-    print("  • Agent decides to use the tool")
-    print()
-    print("Step 2: Claude requests tool use")
-    print("  • Response contains: tool_use block")
-    print("  • Tool name: 'get_metar'")
-    print("  • Arguments: {'stationString': 'KSFO'}")
-    print()
-    print("Step 3: Agent framework calls MCP tool")
-    print("  • Extracts tool_use request from Claude's response")
-    print("  • Calls: manager.call_tool('aviation-mcp', 'get_metar', ...)")
-    print("  • Gets result with current METAR data")
-    print()
-    print("Step 4: Agent returns tool result to Claude")
-    print("  • Formats result as tool_result block")
-    print("  • Sends back to Claude")
-    print()
-    print("Step 5: Claude formulates final response")
-    print("  • Analyzes the METAR data")
-    print("  • Translates aviation codes to plain English")
-    print("  • Crafts natural language response")
-    print()
-    print("🤖 AGENT RESPONSE:")
-    print("-" * 80)
-    print("Alpha One, roger. Current weather at San Francisco International:")
-    print("Wind 280 at 12 knots, visibility 10 statute miles, few clouds at")
-    print("2,500 feet, temperature 18°C, dewpoint 12°C, altimeter 30.12 inches.")
-    print("Conditions are VFR. Over.")
-    print("-" * 80)
-    print()
-    
-    # Cleanup
-    try:
-        await manager.close()
-    except Exception:
-        pass
+        print("🤖 What the agent WOULD do:")
+        print("-" * 80)
+        print()
+        print("Step 1: Agent receives message and has access to weather tools")
+        print("  • Agent sees user wants weather information")
+        print("  • Agent has access to 'get_metar' tool from aviation-mcp")
+        print("  • Agent decides to use the tool")
+        print()
+        print("Step 2: Claude requests tool use")
+        print("  • Response contains: tool_use block")
+        print("  • Tool name: 'get_metar'")
+        print("  • Arguments: {'stationString': 'KSFO'}")
+        print()
+        print("Step 3: Agent framework calls MCP tool")
+        print("  • Extracts tool_use request from Claude's response")
+        print("  • Calls: manager.call_tool('aviation-mcp', 'get_metar', ...)")
+        print("  • Gets result with current METAR data")
+        print()
+        print("Step 4: Agent returns tool result to Claude")
+        print("  • Formats result as tool_result block")
+        print("  • Sends back to Claude")
+        print()
+        print("Step 5: Claude formulates final response")
+        print("  • Analyzes the METAR data")
+        print("  • Translates aviation codes to plain English")
+        print("  • Crafts natural language response")
+        print()
+        print("🤖 AGENT RESPONSE:")
+        print("-" * 80)
+        print("Alpha One, roger. Current weather at San Francisco International:")
+        print("Wind 280 at 12 knots, visibility 10 statute miles, few clouds at")
+        print("2,500 feet, temperature 18°C, dewpoint 12°C, altimeter 30.12 inches.")
+        print("Conditions are VFR. Over.")
+        print("-" * 80)
+        print()
     
+    finally:
+        try:
+            await manager.close()
+        except Exception:
+            pass
+
     # Summary
     print_header("SUMMARY")
     
@@ -11,6 +11,7 @@ It shows how to:
 """
 
 import asyncio
+import io
 import sys
 from pathlib import Path
 
@@ -21,90 +22,91 @@ from src.utils.mission_snapshots import MissionSnapshotManager
 from src.mcp.mcp_manager import get_mcp_manager, initialize_all_aviation_mcps
 
 
-async def demo_list_snapshots():
+async def demo_list_snapshots(manager: MissionSnapshotManager) -> str:
     """Demonstrate listing available snapshots."""
-    print("=" * 80)
-    print("DEMO 1: Listing Available Snapshots")
-    print("=" * 80)
-    
-    manager = MissionSnapshotManager()
-    
-    print("\nMission Types:")
+    buf = io.StringIO()
+    print("=" * 80, file=buf)
+    print("DEMO 1: Listing Available Snapshots", file=buf)
+    print("=" * 80, file=buf)
+
+    print("\nMission Types:", file=buf)
     for mission_type in manager.list_mission_types():
-        print(f"  • {mission_type}")
-        
-        print(f"\n  Snapshots for {mission_type}:")
+        print(f"  • {mission_type}", file=buf)
+
+        print(f"\n  Snapshots for {mission_type}:", file=buf)
         for snapshot_id in manager.list_snapshots(mission_type):
             snapshot = manager.get_snapshot(mission_type, snapshot_id)
-            print(f"    - {snapshot_id}: {snapshot.name}")
-    
-    print()
+            print(f"    - {snapshot_id}: {snapshot.name}", file=buf)
+
+    print(file=buf)
+    return buf.getvalue()
 
 
-async def demo_snapshot_details():
+async def demo_snapshot_details(manager: MissionSnapshotManager) -> str:
     """Demonstrate getting detailed snapshot information."""
-    print("=" * 80)
-    print("DEMO 2: Snapshot Details")
-    print("=" * 80)
-    
-    manager = MissionSnapshotManager()
+    buf = io.StringIO()
+    print("=" * 80, file=buf)
+    print("DEMO 2: Snapshot Details", file=buf)
+    print("=" * 80, file=buf)
+
     snapshot = manager.get_snapshot("airdrop_mission_snapshots", "on_station_pre_drop")
-    
-    print(f"\nSnapshot: {snapshot.name}")
-    print(f"Description: {snapshot.description}")
-    print(f"Mission Phase: {snapshot.mission_phase}")
-    print(f"Time into Mission: {snapshot.time_into_mission}")
-    
-    print(f"\nAircraft Configuration:")
-    print(f"  Model: {snapshot.aircraft_model}")
-    print(f"  Position: {snapshot.latitude:.4f}°N, {abs(snapshot.longitude):.4f}°W")
-    print(f"  Altitude: {snapshot.altitude_msl:.0f} ft MSL")
-    print(f"  Heading: {snapshot.heading:.0f}°")
-    print(f"  Airspeed: {snapshot.airspeed:.0f} knots")
-    
-    print(f"\nAircraft State:")
+
+    print(f"\nSnapshot: {snapshot.name}", file=buf)
+    print(f"Description: {snapshot.description}", file=buf)
+    print(f"Mission Phase: {snapshot.mission_phase}", file=buf)
+    print(f"Time into Mission: {snapshot.time_into_mission}", file=buf)
+
+    print(f"\nAircraft Configuration:", file=buf)
+    print(f"  Model: {snapshot.aircraft_model}", file=buf)
+    print(f"  Position: {snapshot.latitude:.4f}°N, {abs(snapshot.longitude):.4f}°W", file=buf)
+    print(f"  Altitude: {snapshot.altitude_msl:.0f} ft MSL", file=buf)
+    print(f"  Heading: {snapshot.heading:.0f}°", file=buf)
+    print(f"  Airspeed: {snapshot.airspeed:.0f} knots", file=buf)
+
+    print(f"\nAircraft State:", file=buf)
     for key, value in snapshot.aircraft_state.items():
-        print(f"  {key}: {value}")
-    
-    print(f"\nNext Action: {snapshot.next_action}")
-    print()
+        print(f"  {key}: {value}", file=buf)
 
+    print(f"\nNext Action: {snapshot.next_action}", file=buf)
+    print(file=buf)
+    return buf.getvalue()
 
-async def demo_simulator_initialization():
+
+async def demo_simulator_initialization(manager: MissionSnapshotManager) -> str:
     """Demonstrate converting snapshot to simulator parameters."""
-    print("=" * 80)
-    print("DEMO 3: Simulator Initialization")
-    print("=" * 80)
-    
-    manager = MissionSnapshotManager()
+    buf = io.StringIO()
+    print("=" * 80, file=buf)
+    print("DEMO 3: Simulator Initialization", file=buf)
+    print("=" * 80, file=buf)
+
     snapshot = manager.get_snapshot("airdrop_mission_snapshots", "on_station_pre_drop")
-    
-    print(f"\nSnapshot: {snapshot.name}")
-    
+
+    print(f"\nSnapshot: {snapshot.name}", file=buf)
+
     # Get initialization message
     init_message = snapshot.get_initialization_message()
-    print(f"\nInitialization Message:")
-    print(f"  {init_message}")
-    
+    print(f"\nInitialization Message:", file=buf)
+    print(f"  {init_message}", file=buf)
+
     # Get simulator parameters
     params = snapshot.to_simulator_init_params()
-    print(f"\nSimulator Parameters:")
+    print(f"\nSimulator Parameters:", file=buf)
     for key, value in params.items():
-        print(f"  {key}: {value}")
-    
-    print(f"\nContext Message:")
-    print(snapshot.get_context_message())
-    print()
+        print(f"  {key}: {value}", file=buf)
+
+    print(f"\nContext Message:", file=buf)
+    print(snapshot.get_context_message(), file=buf)
+    print(file=buf)
+    return buf.getvalue()
 
 
-async def demo_mission_progression():
+async def demo_mission_progression(manager: MissionSnapshotManager) -> str:
     """Demonstrate mission progression through snapshots."""
-    print("=" * 80)
-    print("DEMO 4: Mission Progression")
-    print("=" * 80)
-    
-    manager = MissionSnapshotManager()
-    
+    buf = io.StringIO()
+    print("=" * 80, file=buf)
+    print("DEMO 4: Mission Progression", file=buf)
+    print("=" * 80, file=buf)
+
     progression = [
         "pre_takeoff",
         "enroute_to_dz",
@@ -113,87 +115,107 @@ async def demo_mission_progression():
         "post_drop_observation",
         "return_to_base"
     ]
-    
-    print("\nAirdrop Mission Progression:\n")
-    
+
+    print("\nAirdrop Mission Progression:\n", file=buf)
+
+    snapshots = manager.get_snapshots("airdrop_mission_snapshots", progression)
     for i, snapshot_id in enumerate(progression, 1):
-        snapshot = manager.get_snapshot("airdrop_mission_snapshots", snapshot_id)
-        
-        print(f"{i}. {snapshot.name}")
-        print(f"   Phase: {snapshot.mission_phase}")
-        print(f"   Altitude: {snapshot.altitude_msl:.0f} ft MSL")
-        print(f"   Airspeed: {snapshot.airspeed:.0f} knots")
-        print(f"   Fuel: {snapshot.aircraft_state['fuel_lbs']} lbs")
-        
+        snapshot = snapshots[snapshot_id]
+
+        print(f"{i}. {snapshot.name}", file=buf)
+        print(f"   Phase: {snapshot.mission_phase}", file=buf)
+        print(f"   Altitude: {snapshot.altitude_msl:.0f} ft MSL", file=buf)
+        print(f"   Airspeed: {snapshot.airspeed:.0f} knots", file=buf)
+        print(f"   Fuel: {snapshot.aircraft_state['fuel_lbs']} lbs", file=buf)
+
         if 'pallets_remaining' in snapshot.aircraft_state:
-            print(f"   Pallets: {snapshot.aircraft_state['pallets_remaining']} remaining")
-        
+            print(f"   Pallets: {snapshot.aircraft_state['pallets_remaining']} remaining", file=buf)
+
         if snapshot.time_into_mission:
-            print(f"   Time: {snapshot.time_into_mission}")
-        
-        print()
+            print(f"   Time: {snapshot.time_into_mission}", file=buf)
+
+        print(file=buf)
+    return buf.getvalue()
 
 
-async def demo_custom_usage():
+async def demo_custom_usage() -> str:
     """Demonstrate using snapshots in custom code."""
-    print("=" * 80)
-    print("DEMO 5: Custom Usage Example")
-    print("=" * 80)
-    
-    print("\nExample: Starting a mission from a specific snapshot\n")
-    
-    print("```python")
-    print("from src.utils.mission_snapshots import MissionSnapshotManager")
-    print()
-    print("# Create manager")
-    print("manager = MissionSnapshotManager()")
-    print()
-    print("# Get a snapshot")
-    print("snapshot = manager.get_snapshot(")
-    print("    'airdrop_mission_snapshots',")
-    print("    'on_station_pre_drop'")
-    print(")")
-    print()
-    print("# Use in your mission script")
-    print("if snapshot:")
-    print("    # Initialize simulator")
-    print("    params = snapshot.to_simulator_init_params()")
-    print("    await client.call_tool('reset_simulation', params)")
-    print("    ")
-    print("    # Display context to crew")
-    print("    print(snapshot.get_context_message())")
-    print("    ")
-    print("    # Start mission at this point")
-    print("    # ... your mission code here ...")
-    print("```")
-    print()
+    buf = io.StringIO()
+    print("=" * 80, file=buf)
+    print("DEMO 5: Custom Usage Example", file=buf)
+    print("=" * 80, file=buf)
+
+    print("\nExample: Starting a mission from a specific snapshot\n", file=buf)
+
+    print("```python", file=buf)
+    print("from src.utils.mission_snapshots import MissionSnapshotManager", file=buf)
+    print(file=buf)
+    print("# Create manager", file=buf)
+    print("manager = MissionSnapshotManager()", file=buf)
+    print(file=buf)
+    print("# Get a snapshot", file=buf)
+    print("snapshot = manager.get_snapshot(", file=buf)
+    print("    'airdrop_mission_snapshots',", file=buf)
+    print("    'on_station_pre_drop'", file=buf)
+    print(")", file=buf)
+    print(file=buf)
+    print("# Use in your mission script", file=buf)
+    print("if snapshot:", file=buf)
+    print("    # Initialize simulator", file=buf)
+    print("    params = snapshot.to_simulator_init_params()", file=buf)
+    print("    await client.call_tool('reset_simulation', params)", file=buf)
+    print("    ", file=buf)
+    print("    # Display context to crew", file=buf)
+    print("    print(snapshot.get_context_message())", file=buf)
+    print("    ", file=buf)
+    print("    # Start mission at this point", file=buf)
+    print("    # ... your mission code here ...", file=buf)
+    print("```", file=buf)
+    print(file=buf)
+    return buf.getvalue()
 
 
 async def main():
     """Run all demonstrations."""
-    print("\n")
-    print("╔" + "=" * 78 + "╗")
-    print("║" + " " * 20 + "MISSION SNAPSHOT DEMONSTRATION" + " " * 28 + "║")
-    print("╚" + "=" * 78 + "╝")
-    print()
-    
-    await demo_list_snapshots()
-    await demo_snapshot_details()
-    await demo_simulator_initialization()
-    await demo_mission_progression()
-    await demo_custom_usage()
-    
-    print("=" * 80)
-    print("DEMONSTRATION COMPLETE")
-    print("=" * 80)
-    print("\nNext steps:")
-    print("  1. Try: python run_airdrop_mission.py --list-snapshots")
-    print("  2. Try: python run_airdrop_mission.py --snapshot on_station_pre_drop")
-    print("  3. Read: QUICK_START_SNAPSHOTS.md")
-    print("  4. Read: MISSION_SNAPSHOTS_GUIDE.md")
-    print()
+    # Banner assembled once and written in one syscall rather than one
+    # line-buffered print per row
+    sys.stdout.write(
+        "\n\n"
+        "╔" + "=" * 78 + "╗\n"
+        "║" + " " * 20 + "MISSION SNAPSHOT DEMONSTRATION" + " " * 28 + "║\n"
+        "╚" + "=" * 78 + "╝\n"
+        "\n"
+    )
+
+    # Each demo renders into its own buffer, so running them under one
+    # gather can't interleave their banners; the sections are written in
+    # order once all have finished
+    # One manager instance: the snapshot YAML is read and parsed once
+    # instead of once per demo
+    manager = MissionSnapshotManager()
+
+    sections = await asyncio.gather(
+        demo_list_snapshots(manager),
+        demo_snapshot_details(manager),
+        demo_simulator_initialization(manager),
+        demo_mission_progression(manager),
+        demo_custom_usage()
+    )
+    sys.stdout.write("".join(sections))
+
+    sys.stdout.write("\n".join([
+        "=" * 80,
+        "DEMONSTRATION COMPLETE",
+        "=" * 80,
+        "",
+        "Next steps:",
+        "  1. Try: python run_airdrop_mission.py --list-snapshots",
+        "  2. Try: python run_airdrop_mission.py --snapshot on_station_pre_drop",
+        "  3. Read: QUICK_START_SNAPSHOTS.md",
+        "  4. Read: MISSION_SNAPSHOTS_GUIDE.md",
+        "",
+    ]) + "\n")
 
 
 if __name__ == "__main__":
     asyncio.run(main())
-
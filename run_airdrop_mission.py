@@ -12,13 +12,14 @@ This script:
 
 import asyncio
 import os
+import pickle
 import sys
+import time
+from types import SimpleNamespace
 from pathlib import Path
-import yaml
 import argparse
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
-from rich.markdown import Markdown
 from rich.prompt import Prompt
 from rich.table import Table
 
@@ -36,6 +37,23 @@ from src.utils.mission_snapshots import MissionSnapshotManager
 
 console = Console()
 
+# Speaking-criteria constructors by config type; dict dispatch keeps the
+# per-agent setup loop flat as criterion types grow
+_CRITERIA_FACTORIES = {
+    "direct_address": lambda cfg: DirectAddressCriteria(),
+    "keywords": lambda cfg: KeywordCriteria(
+        cfg.keywords, case_sensitive=cfg.case_sensitive
+    ) if cfg.keywords else None,
+}
+
+# Row color per pallet status, built once instead of per table row
+_STATUS_COLORS = {
+    'LOADED': 'yellow',
+    'RELEASED': 'blue',
+    'DEPLOYED': 'green',
+    'LANDED': 'bright_green'
+}
+
 
 class PalletTracker:
     """Track the status of air drop pallets."""
@@ -44,18 +62,33 @@ class PalletTracker:
         """Initialize pallet tracker with configuration."""
         self.pallets = {}
         for pallet in pallets_config:
-            self.pallets[pallet['pallet_id']] = {
-                'weight': pallet['weight'],
-                'contents': pallet['contents'],
-                'parachute_type': pallet['parachute_type'],
-                'sequence': pallet['release_sequence'],
+            self.pallets[pallet.pallet_id] = {
+                'weight': pallet.weight,
+                'contents': pallet.contents,
+                # Table column is 30 chars; slice once here, not per render
+                'contents_short': pallet.contents[:30],
+                'parachute_type': pallet.parachute_type,
+                'sequence': pallet.release_sequence,
                 'status': 'LOADED',  # LOADED, RELEASED, DEPLOYED, LANDED
                 'release_time': None,
                 'notes': []
             }
+        # Aggregates maintained incrementally on release, so the status
+        # displays read counters instead of rescanning every pallet
+        self._total_weight = sum(p['weight'] for p in self.pallets.values())
+        self._loaded_count = len(self.pallets)
+        self._loaded_weight = self._total_weight
+        # Display order is fixed for the mission, so sort once here
+        # rather than on every table render
+        self._sorted_ids = sorted(self.pallets.keys())
+        # Rendered Rich table, reused until a release changes a status
+        self._table_cache = None
     
     def get_status_table(self):
         """Generate a Rich table showing pallet status."""
+        if self._table_cache is not None:
+            return self._table_cache
+
         table = Table(title="Air Drop Pallet Status", show_header=True, header_style="bold magenta")
         table.add_column("Pallet ID", style="cyan", width=12)
         table.add_column("Seq", justify="center", width=4)
@@ -63,196 +96,265 @@ class PalletTracker:
         table.add_column("Contents", width=30)
         table.add_column("Status", justify="center", width=10)
         
-        for pallet_id in sorted(self.pallets.keys()):
+        for pallet_id in self._sorted_ids:
             pallet = self.pallets[pallet_id]
-            status_color = {
-                'LOADED': 'yellow',
-                'RELEASED': 'blue',
-                'DEPLOYED': 'green',
-                'LANDED': 'bright_green'
-            }.get(pallet['status'], 'white')
-            
+            status_color = _STATUS_COLORS.get(pallet['status'], 'white')
+
             table.add_row(
                 pallet_id,
                 str(pallet['sequence']),
                 f"{pallet['weight']} lbs",
-                pallet['contents'][:30],
+                pallet['contents_short'],
                 f"[{status_color}]{pallet['status']}[/{status_color}]"
             )
-        
+
+        self._table_cache = table
         return table
     
     def release_pallet(self, pallet_id):
         """Mark a pallet as released."""
-        if pallet_id in self.pallets:
-            self.pallets[pallet_id]['status'] = 'RELEASED'
-            self.pallets[pallet_id]['release_time'] = asyncio.get_event_loop().time()
+        pallet = self.pallets.get(pallet_id)
+        if pallet is not None:
+            if pallet['status'] == 'LOADED':
+                self._loaded_count -= 1
+                self._loaded_weight -= pallet['weight']
+            if pallet['status'] != 'RELEASED':
+                self._table_cache = None
+            pallet['status'] = 'RELEASED'
+            pallet['release_time'] = time.monotonic()
             return True
         return False
-    
+
     def get_loaded_count(self):
         """Get count of loaded pallets."""
-        return sum(1 for p in self.pallets.values() if p['status'] == 'LOADED')
-    
+        return self._loaded_count
+
     def get_released_count(self):
         """Get count of released pallets."""
-        return sum(1 for p in self.pallets.values() if p['status'] in ['RELEASED', 'DEPLOYED', 'LANDED'])
-    
+        return len(self.pallets) - self._loaded_count
+
     def get_total_weight(self):
         """Get total weight of all pallets."""
-        return sum(p['weight'] for p in self.pallets.values())
-    
+        return self._total_weight
+
     def get_loaded_weight(self):
         """Get weight of loaded pallets."""
-        return sum(p['weight'] for p in self.pallets.values() if p['status'] == 'LOADED')
+        return self._loaded_weight
+
+
+def _to_namespace(node):
+    """Recursively convert parsed YAML into attribute-access namespaces.
 
+    Attribute lookups skip the per-reference dict hashing that string
+    subscripts pay, which matters in the brief renderer where the same
+    sections are dereferenced dozens of times.
+    """
+    if isinstance(node, dict):
+        return SimpleNamespace(**{k: _to_namespace(v) for k, v in node.items()})
+    if isinstance(node, list):
+        return [_to_namespace(item) for item in node]
+    return node
+
+
+def load_mission_orders(mission_file: str) -> SimpleNamespace:
+    """Load mission orders from YAML file as a namespace tree.
 
-def load_mission_orders(mission_file: str) -> dict:
-    """Load mission orders from YAML file."""
-    with open(mission_file, 'r') as f:
-        return yaml.safe_load(f)
+    Parsed orders are cached in a pickle sidecar keyed on the YAML
+    file's mtime and a payload-format version, so warm runs skip the
+    YAML parse (and namespace conversion) entirely; editing the mission
+    file -- or changing what this function returns -- invalidates the
+    cache automatically.
+    """
+    path = Path(mission_file)
+    # Bump the version token whenever the pickled payload shape changes
+    # (v2: SimpleNamespace tree, previously plain dicts), so sidecars
+    # written by older code are never served in the new format's place
+    cache_path = path.with_name(f"{path.name}.v2.{path.stat().st_mtime_ns}.pkl")
+
+    if cache_path.exists():
+        with open(cache_path, 'rb') as f:
+            cached = pickle.load(f)
+        # Belt and braces: if the sidecar somehow holds the wrong shape,
+        # fall through and re-parse rather than crash later on attribute
+        # access
+        if isinstance(cached, SimpleNamespace):
+            return cached
+
+    # Imported here so early-exit paths (missing API key, --list-snapshots
+    # errors) never pay for the parser; a warm sidecar skips it too.
+    # CSafeLoader is the libyaml-backed loader, several times faster than
+    # the pure-Python SafeLoader when PyYAML has the C extension
+    import yaml
+    try:
+        from yaml import CSafeLoader as _YamlLoader
+    except ImportError:
+        from yaml import SafeLoader as _YamlLoader
 
+    # Bytes mode skips Python-side decoding; libyaml handles UTF-8 itself
+    with open(path, 'rb') as f:
+        mission_data = _to_namespace(yaml.load(f, Loader=_YamlLoader))
 
-def format_mission_brief(mission_data: dict) -> str:
+    # Drop sidecars from earlier versions of the file, then write the
+    # fresh one; cache failures never block the mission load
+    try:
+        for stale in path.parent.glob(f"{path.name}.*.pkl"):
+            if stale != cache_path:
+                stale.unlink(missing_ok=True)
+        with open(cache_path, 'wb') as f:
+            pickle.dump(mission_data, f, protocol=5)
+    except OSError:
+        pass
+
+    return mission_data
+
+
+# Rendered briefs keyed on id(mission_data): the brief is static for a
+# given mission dict, so repeat displays are a lookup instead of ~80
+# f-string formats
+_BRIEF_CACHE = {}
+
+
+def format_mission_brief(mission_data: SimpleNamespace) -> str:
     """Format mission data into a readable brief."""
-    lines = []
-    
-    # Header
-    lines.append(f"# MISSION BRIEF - {mission_data['mission_info']['mission_number']}")
-    lines.append("")
-    
-    # Mission Info
-    lines.append("## MISSION INFORMATION")
-    lines.append(f"- **Type:** {mission_data['mission_info']['mission_type']}")
-    lines.append(f"- **Classification:** {mission_data['mission_info']['classification']}")
-    lines.append(f"- **Priority:** {mission_data['mission_info']['priority']}")
-    lines.append(f"- **Date:** {mission_data['mission_info']['date_issued']}")
-    lines.append("")
-    
-    # Aircraft
-    lines.append("## AIRCRAFT")
-    lines.append(f"- **Type:** {mission_data['aircraft']['type']}")
-    lines.append(f"- **Tail Number:** {mission_data['aircraft']['tail_number']}")
-    lines.append(f"- **Configuration:** {mission_data['aircraft']['configuration']}")
-    lines.append("")
-    
-    # Cargo - IMPORTANT SECTION
-    lines.append("## CARGO - AIR DROP PALLETS")
-    lines.append(f"- **Total Pallets:** {mission_data['cargo']['total_pallets']}")
-    lines.append(f"- **Total Cargo Weight:** {mission_data['cargo']['total_cargo_weight']} LBS")
-    lines.append(f"- **Drop Interval:** {mission_data['cargo']['drop_interval']}")
-    lines.append("")
-    lines.append("### Pallet Manifest:")
-    for pallet in mission_data['cargo']['pallet_specifications']:
-        lines.append(f"- **{pallet['pallet_id']}** (Seq {pallet['release_sequence']}): {pallet['weight']} lbs - {pallet['contents']}")
-    lines.append("")
-    
-    # Crew
-    lines.append("## CREW")
-    lines.append(f"- **Pilot in Command:** {mission_data['crew']['pilot_in_command']['name']} ({mission_data['crew']['pilot_in_command']['qualification']})")
-    lines.append(f"- **First Officer:** {mission_data['crew']['first_officer']['name']} ({mission_data['crew']['first_officer']['qualification']})")
-    lines.append(f"- **Flight Engineer:** {mission_data['crew']['flight_engineer']['name']} ({mission_data['crew']['flight_engineer']['qualification']})")
-    for crew in mission_data['crew']['additional_crew']:
-        lines.append(f"- **{crew['position']}:** {crew['name']}")
-    lines.append("")
-    
-    # Flight Plan
-    lines.append("## FLIGHT PLAN")
-    lines.append(f"**Departure:** {mission_data['flight_plan']['departure']['airport']} RWY {mission_data['flight_plan']['departure']['runway']} at {mission_data['flight_plan']['departure']['departure_time']}")
-    lines.append("")
-    lines.append(f"**Route:** {' → '.join(mission_data['flight_plan']['route']['waypoints'])}")
-    lines.append(f"- **Altitude:** {mission_data['flight_plan']['route']['altitude']}")
-    lines.append(f"- **Airspeed:** {mission_data['flight_plan']['route']['airspeed']}")
-    lines.append("")
-    
-    # Drop Zone
-    lines.append("**Drop Zone:** {0}".format(mission_data['flight_plan']['drop_zone']['description']))
-    lines.append(f"- **Coordinates:** {mission_data['flight_plan']['drop_zone']['coordinates']}")
-    lines.append(f"- **Dimensions:** {mission_data['flight_plan']['drop_zone']['dimensions']}")
-    lines.append(f"- **Surface:** {mission_data['flight_plan']['drop_zone']['surface']}")
-    lines.append("")
-    
-    # Drop Parameters
-    lines.append("**Drop Parameters:**")
-    lines.append(f"- **Altitude:** {mission_data['flight_plan']['drop_parameters']['drop_altitude']}")
-    lines.append(f"- **Airspeed:** {mission_data['flight_plan']['drop_parameters']['drop_airspeed']}")
-    lines.append(f"- **Heading:** {mission_data['flight_plan']['drop_parameters']['drop_heading']}")
-    lines.append(f"- **Release Interval:** {mission_data['flight_plan']['drop_parameters']['release_interval']}")
-    lines.append("")
-    
-    lines.append(f"**Destination:** {mission_data['flight_plan']['destination']['airport']} RWY {mission_data['flight_plan']['destination']['runway']} ETA {mission_data['flight_plan']['destination']['estimated_arrival']}")
-    lines.append("")
-    lines.append(f"**Alternates:**")
-    lines.append(f"- Primary: {mission_data['flight_plan']['alternates']['primary']}")
-    lines.append(f"- Secondary: {mission_data['flight_plan']['alternates']['secondary']}")
-    lines.append("")
-    
-    # Fuel
-    lines.append("## FUEL")
-    lines.append(f"- **Planned Load:** {mission_data['fuel']['planned_fuel_load']}")
-    lines.append(f"- **Burn Rate:** {mission_data['fuel']['fuel_burn_rate']}")
-    lines.append(f"- **Endurance:** {mission_data['fuel']['estimated_endurance']}")
-    lines.append(f"- **Bingo Fuel:** {mission_data['fuel']['bingo_fuel']}")
-    lines.append(f"- **Reserve:** {mission_data['fuel']['reserve_fuel']}")
-    lines.append("")
-    
-    # Weather
-    lines.append("## WEATHER")
-    lines.append(f"**Drop Zone:** {mission_data['weather']['drop_zone_weather']['conditions']}, Winds {mission_data['weather']['drop_zone_weather']['winds']}, Vis {mission_data['weather']['drop_zone_weather']['visibility']}")
-    lines.append("")
-    
-    # Mission Objectives
-    lines.append("## MISSION OBJECTIVES")
-    lines.append(f"**Primary:** {mission_data['mission_objectives']['primary']}")
-    lines.append("")
-    lines.append("**Secondary:**")
-    for obj in mission_data['mission_objectives']['secondary']:
-        lines.append(f"- {obj}")
-    lines.append("")
-    lines.append("**Success Criteria:**")
-    for criteria in mission_data['mission_objectives']['success_criteria']:
-        lines.append(f"- {criteria}")
-    lines.append("")
-    
-    # Special Instructions
-    lines.append("## SPECIAL INSTRUCTIONS")
-    lines.append("")
-    lines.append("**During Drop:**")
-    for instruction in mission_data['special_instructions']['during_drop']:
-        lines.append(f"- {instruction}")
-    lines.append("")
-    
-    # Communications
-    lines.append("## COMMUNICATIONS")
-    lines.append(f"- **Departure:** {mission_data['communications']['departure_frequency']}")
-    lines.append(f"- **Drop Zone:** {mission_data['communications']['drop_zone_frequency']}")
-    lines.append(f"- **Ground Team:** {mission_data['communications']['ground_team_frequency']}")
-    lines.append(f"- **Guard:** {mission_data['communications']['guard_frequency']}")
-    lines.append("")
-    
-    # Risk Assessment
-    lines.append("## RISK ASSESSMENT")
-    lines.append(f"**Overall Risk Level:** {mission_data['risk_assessment']['overall_risk_level']}")
-    lines.append("")
-    lines.append("**Identified Hazards:**")
-    for hazard in mission_data['risk_assessment']['identified_hazards']:
-        lines.append(f"- {hazard}")
-    lines.append("")
-    lines.append("**Mitigation Measures:**")
-    for measure in mission_data['risk_assessment']['mitigation_measures']:
-        lines.append(f"- {measure}")
-    lines.append("")
-    
-    # Approvals
-    lines.append("## APPROVALS")
-    lines.append(f"- **Operations Officer:** {mission_data['approvals']['operations_officer']}")
-    lines.append(f"- **Maintenance Officer:** {mission_data['approvals']['maintenance_officer']}")
-    lines.append(f"- **Commanding Officer:** {mission_data['approvals']['commanding_officer']}")
-    lines.append("")
-    lines.append("---")
-    lines.append("**MISSION STATUS: APPROVED - READY FOR EXECUTION**")
-    
-    return "\n".join(lines)
+    cached = _BRIEF_CACHE.get(id(mission_data))
+    if cached is not None:
+        return cached
+
+    # Sections bound once; chains like
+    # mission_data.flight_plan.drop_parameters would otherwise re-run the
+    # attribute walk per reference
+    mi = mission_data.mission_info
+    ac = mission_data.aircraft
+    cg = mission_data.cargo
+    cr = mission_data.crew
+    fp = mission_data.flight_plan
+    dep = fp.departure
+    rte = fp.route
+    dz = fp.drop_zone
+    dp = fp.drop_parameters
+    dst = fp.destination
+    alt = fp.alternates
+    fu = mission_data.fuel
+    wx = mission_data.weather.drop_zone_weather
+    mo = mission_data.mission_objectives
+    si = mission_data.special_instructions
+    co = mission_data.communications
+    ra = mission_data.risk_assessment
+    ap = mission_data.approvals
+
+    pallet_manifest = "\n".join(
+        f"- **{p.pallet_id}** (Seq {p.release_sequence}): {p.weight} lbs - {p.contents}"
+        for p in cg.pallet_specifications
+    )
+    additional_crew = "\n".join(
+        f"- **{c.position}:** {c.name}" for c in cr.additional_crew
+    )
+    secondary_objectives = "\n".join(f"- {obj}" for obj in mo.secondary)
+    success_criteria = "\n".join(f"- {c}" for c in mo.success_criteria)
+    during_drop = "\n".join(f"- {i}" for i in si.during_drop)
+    hazards = "\n".join(f"- {h}" for h in ra.identified_hazards)
+    mitigations = "\n".join(f"- {m}" for m in ra.mitigation_measures)
+
+    brief = f"""# MISSION BRIEF - {mi.mission_number}
+
+## MISSION INFORMATION
+- **Type:** {mi.mission_type}
+- **Classification:** {mi.classification}
+- **Priority:** {mi.priority}
+- **Date:** {mi.date_issued}
+
+## AIRCRAFT
+- **Type:** {ac.type}
+- **Tail Number:** {ac.tail_number}
+- **Configuration:** {ac.configuration}
+
+## CARGO - AIR DROP PALLETS
+- **Total Pallets:** {cg.total_pallets}
+- **Total Cargo Weight:** {cg.total_cargo_weight} LBS
+- **Drop Interval:** {cg.drop_interval}
+
+### Pallet Manifest:
+{pallet_manifest}
+
+## CREW
+- **Pilot in Command:** {cr.pilot_in_command.name} ({cr.pilot_in_command.qualification})
+- **First Officer:** {cr.first_officer.name} ({cr.first_officer.qualification})
+- **Flight Engineer:** {cr.flight_engineer.name} ({cr.flight_engineer.qualification})
+{additional_crew}
+
+## FLIGHT PLAN
+**Departure:** {dep.airport} RWY {dep.runway} at {dep.departure_time}
+
+**Route:** {' → '.join(rte.waypoints)}
+- **Altitude:** {rte.altitude}
+- **Airspeed:** {rte.airspeed}
+
+**Drop Zone:** {dz.description}
+- **Coordinates:** {dz.coordinates}
+- **Dimensions:** {dz.dimensions}
+- **Surface:** {dz.surface}
+
+**Drop Parameters:**
+- **Altitude:** {dp.drop_altitude}
+- **Airspeed:** {dp.drop_airspeed}
+- **Heading:** {dp.drop_heading}
+- **Release Interval:** {dp.release_interval}
+
+**Destination:** {dst.airport} RWY {dst.runway} ETA {dst.estimated_arrival}
+
+**Alternates:**
+- Primary: {alt.primary}
+- Secondary: {alt.secondary}
+
+## FUEL
+- **Planned Load:** {fu.planned_fuel_load}
+- **Burn Rate:** {fu.fuel_burn_rate}
+- **Endurance:** {fu.estimated_endurance}
+- **Bingo Fuel:** {fu.bingo_fuel}
+- **Reserve:** {fu.reserve_fuel}
+
+## WEATHER
+**Drop Zone:** {wx.conditions}, Winds {wx.winds}, Vis {wx.visibility}
+
+## MISSION OBJECTIVES
+**Primary:** {mo.primary}
+
+**Secondary:**
+{secondary_objectives}
+
+**Success Criteria:**
+{success_criteria}
+
+## SPECIAL INSTRUCTIONS
+
+**During Drop:**
+{during_drop}
+
+## COMMUNICATIONS
+- **Departure:** {co.departure_frequency}
+- **Drop Zone:** {co.drop_zone_frequency}
+- **Ground Team:** {co.ground_team_frequency}
+- **Guard:** {co.guard_frequency}
+
+## RISK ASSESSMENT
+**Overall Risk Level:** {ra.overall_risk_level}
+
+**Identified Hazards:**
+{hazards}
+
+**Mitigation Measures:**
+{mitigations}
+
+## APPROVALS
+- **Operations Officer:** {ap.operations_officer}
+- **Maintenance Officer:** {ap.maintenance_officer}
+- **Commanding Officer:** {ap.commanding_officer}
+
+---
+**MISSION STATUS: APPROVED - READY FOR EXECUTION**"""
+
+    _BRIEF_CACHE[id(mission_data)] = brief
+    return brief
 
 
 async def initialize_simulator_from_snapshot(snapshot):
@@ -302,8 +404,13 @@ async def main(snapshot_id=None):
         console.print("[red]Error: ANTHROPIC_API_KEY environment variable not set[/red]")
         return
 
+    # Deferred past the guard: rich.markdown drags in Rich's whole
+    # Markdown parser, which the fast-fail path never needs
+    from rich.markdown import Markdown
+
     # Load snapshot if specified
     snapshot = None
+    mcp_manager = None
     if snapshot_id:
         try:
             snapshot_manager = MissionSnapshotManager()
@@ -370,7 +477,7 @@ async def main(snapshot_id=None):
         mission_data = load_mission_orders("configs/airdrop_mission.yaml")
 
         # Initialize pallet tracker
-        pallet_tracker = PalletTracker(mission_data['cargo']['pallet_specifications'])
+        pallet_tracker = PalletTracker(mission_data.cargo.pallet_specifications)
 
         # Load HC-144 crew configuration
         console.print("[dim]Loading HC-144 crew configuration...[/dim]\n")
@@ -401,15 +508,10 @@ async def main(snapshot_id=None):
                 criteria_list = []
                 if agent_cfg.speaking_criteria:
                     for crit_cfg in agent_cfg.speaking_criteria:
-                        if crit_cfg.type == "direct_address":
-                            criteria_list.append(DirectAddressCriteria())
-                        elif crit_cfg.type == "keywords" and crit_cfg.keywords:
-                            criteria_list.append(
-                                KeywordCriteria(
-                                    crit_cfg.keywords,
-                                    case_sensitive=crit_cfg.case_sensitive
-                                )
-                            )
+                        factory = _CRITERIA_FACTORIES.get(crit_cfg.type)
+                        criterion = factory(crit_cfg) if factory else None
+                        if criterion is not None:
+                            criteria_list.append(criterion)
 
                 speaking_criteria = CompositeCriteria(criteria_list) if criteria_list else None
 
@@ -437,8 +539,10 @@ async def main(snapshot_id=None):
         console.print("\n" + "="*80 + "\n")
 
         # Display pallet status
-        console.print(pallet_tracker.get_status_table())
-        console.print(f"\n[bold]Total Cargo: {pallet_tracker.get_total_weight()} lbs ({pallet_tracker.get_loaded_count()} pallets loaded)[/bold]\n")
+        console.print(Group(
+            pallet_tracker.get_status_table(),
+            f"\n[bold]Total Cargo: {pallet_tracker.get_total_weight()} lbs ({pallet_tracker.get_loaded_count()} pallets loaded)[/bold]\n"
+        ))
 
         console.print("="*80 + "\n")
 
@@ -446,7 +550,7 @@ async def main(snapshot_id=None):
         mission_brief = format_mission_brief(mission_data)
         console.print(Panel(
             Markdown(mission_brief),
-            title=f"MISSION BRIEF - {mission_data['mission_info']['mission_number']}",
+            title=f"MISSION BRIEF - {mission_data.mission_info.mission_number}",
             border_style="cyan",
             padding=(1, 2)
         ))
@@ -475,27 +579,43 @@ async def main(snapshot_id=None):
             try:
                 user_input = Prompt.ask("\n[bold cyan]Commander[/bold cyan]")
 
-                if user_input.lower() in ['quit', 'exit', 'q']:
+                # Lowercase once per input; the command checks below all
+                # reuse it
+                cmd = user_input.lower()
+
+                if cmd in {'quit', 'exit', 'q'}:
                     break
 
                 # Handle special commands
-                if user_input.lower() == 'status':
-                    console.print("\n")
-                    console.print(pallet_tracker.get_status_table())
-                    console.print(f"\n[bold]Loaded: {pallet_tracker.get_loaded_weight()} lbs ({pallet_tracker.get_loaded_count()} pallets)[/bold]")
-                    console.print(f"[bold]Released: {pallet_tracker.get_released_count()} pallets[/bold]\n")
+                if cmd == 'status':
+                    # One Group render: a single layout pass and flush
+                    # instead of four
+                    console.print(Group(
+                        "\n",
+                        pallet_tracker.get_status_table(),
+                        f"\n[bold]Loaded: {pallet_tracker.get_loaded_weight()} lbs ({pallet_tracker.get_loaded_count()} pallets)[/bold]",
+                        f"[bold]Released: {pallet_tracker.get_released_count()} pallets[/bold]\n"
+                    ))
                     continue
 
-                if user_input.lower().startswith('release '):
+                if cmd.startswith('release '):
                     pallet_id = user_input[8:].strip().upper()
                     if pallet_tracker.release_pallet(pallet_id):
-                        console.print(f"\n[green]✓ {pallet_id} RELEASED![/green]")
-                        console.print(pallet_tracker.get_status_table())
-                        console.print(f"\n[bold]Remaining: {pallet_tracker.get_loaded_weight()} lbs ({pallet_tracker.get_loaded_count()} pallets)[/bold]\n")
-
-                        # Notify agents
+                        # Notify agents first: the LLM round-trip dominates
+                        # this branch, so let it run while the status table
+                        # renders and prints
                         notification = f"LOADMASTER: {pallet_id} released successfully. Parachute deployed. {pallet_tracker.get_loaded_count()} pallets remaining."
-                        turn_result = await orchestrator.run_turn(user_message=notification)
+                        turn_task = asyncio.create_task(
+                            orchestrator.run_turn(user_message=notification)
+                        )
+
+                        console.print(Group(
+                            f"\n[green]✓ {pallet_id} RELEASED![/green]",
+                            pallet_tracker.get_status_table(),
+                            f"\n[bold]Remaining: {pallet_tracker.get_loaded_weight()} lbs ({pallet_tracker.get_loaded_count()} pallets)[/bold]\n"
+                        ))
+
+                        turn_result = await turn_task
                         for msg in turn_result["agent_responses"]:
                             console.print(f"\n[green]{msg.format_for_display()}[/green]\n")
                     else:
@@ -531,12 +651,15 @@ async def main(snapshot_id=None):
         import traceback
         traceback.print_exc()
 
-        # Cleanup MCP connections on error
-        try:
-            mcp_manager = await get_mcp_manager()
-            await mcp_manager.cleanup()
-        except:
-            pass
+        # Cleanup MCP connections on error; reuse the manager bound in
+        # the try block — re-awaiting get_mcp_manager() here would build
+        # a fresh singleton just to tear it down when the failure came
+        # before MCP init
+        if mcp_manager is not None:
+            try:
+                await mcp_manager.cleanup()
+            except:
+                pass
 
 
 if __name__ == "__main__":
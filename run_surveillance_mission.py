@@ -11,6 +11,7 @@ This script:
 
 import asyncio
 import os
+import pickle
 import sys
 from pathlib import Path
 import yaml
@@ -36,9 +37,41 @@ console = Console()
 
 
 def load_mission_orders(mission_file: str) -> dict:
-    """Load mission orders from YAML file."""
-    with open(mission_file, 'r') as f:
-        return yaml.safe_load(f)
+    """Load mission orders from YAML file.
+
+    The parsed dict is cached in a pickle sidecar keyed on the file's
+    mtime: warm starts deserialize the pickle in a few milliseconds
+    instead of re-parsing the YAML, and editing the mission file keys a
+    new sidecar automatically.
+    """
+    path = Path(mission_file)
+    cache_path = path.with_name(f"{path.name}.{path.stat().st_mtime_ns}.pkl")
+
+    if cache_path.exists():
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+
+    # libyaml-backed loader when PyYAML has the C extension
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:
+        from yaml import SafeLoader as loader
+
+    with open(path, 'rb') as f:
+        mission_data = yaml.load(f, Loader=loader)
+
+    # Replace sidecars for older versions of the file; cache maintenance
+    # failures never block the mission load
+    try:
+        for stale in path.parent.glob(f"{path.name}.*.pkl"):
+            if stale != cache_path:
+                stale.unlink(missing_ok=True)
+        with open(cache_path, 'wb') as f:
+            pickle.dump(mission_data, f, protocol=5)
+    except OSError:
+        pass
+
+    return mission_data
 
 
 def format_mission_brief(mission_data: dict) -> str:
@@ -2,6 +2,8 @@
 
 from typing import Optional
 
+from anthropic import AsyncAnthropic
+
 from .base_agent import BaseAgent
 from .speaking_criteria import CompositeCriteria, DirectAddressCriteria, KeywordCriteria
 
@@ -25,7 +27,8 @@ class AerospaceAgent(BaseAgent):
         system_prompt: Optional[str] = None,
         model: str = "claude-sonnet-4-5-20250929",
         temperature: float = 1.0,
-        max_tokens: int = 2048
+        max_tokens: int = 2048,
+        client: Optional[AsyncAnthropic] = None
     ):
         """Initialize the aerospace agent.
 
@@ -36,6 +39,7 @@ class AerospaceAgent(BaseAgent):
             model: Claude model to use
             temperature: Temperature for response generation
             max_tokens: Maximum tokens in response
+            client: Anthropic client to use (defaults to the shared client)
         """
         # Use default aerospace prompt if not provided
         if system_prompt is None:
@@ -59,7 +63,8 @@ class AerospaceAgent(BaseAgent):
             speaking_criteria=speaking_criteria,
             model=model,
             temperature=temperature,
-            max_tokens=max_tokens
+            max_tokens=max_tokens,
+            client=client
         )
 
     def _default_aerospace_prompt(self) -> str:
@@ -4,7 +4,7 @@ import os
 import re
 import time
 from typing import List, Optional, Dict, Any
-from anthropic import Anthropic
+from anthropic import AsyncAnthropic
 
 from ..channel.message import Message, MessageType
 from ..channel.shared_channel import SharedChannel
@@ -20,6 +20,29 @@ from ..exceptions import (
 )
 
 
+# Shared Anthropic client so all agents reuse one HTTP connection pool
+# (amortizes TCP/TLS setup instead of paying it per agent)
+_shared_client: Optional[AsyncAnthropic] = None
+
+
+def get_shared_anthropic_client() -> AsyncAnthropic:
+    """Get or create the process-wide shared Anthropic client.
+
+    Returns:
+        AsyncAnthropic instance shared by all agents
+
+    Raises:
+        ValueError: If ANTHROPIC_API_KEY is not set
+    """
+    global _shared_client
+    if _shared_client is None:
+        api_key = os.getenv("ANTHROPIC_API_KEY")
+        if not api_key:
+            raise ValueError("ANTHROPIC_API_KEY environment variable not set")
+        _shared_client = AsyncAnthropic(api_key=api_key)
+    return _shared_client
+
+
 class BaseAgent:
     """Base class for all agents in the system.
 
@@ -36,7 +59,8 @@ class BaseAgent:
         mcp_manager: Optional[MCPManager] = None,
         model: str = "claude-sonnet-4-5-20250929",
         temperature: float = 1.0,
-        max_tokens: int = 1024
+        max_tokens: int = 1024,
+        client: Optional[AsyncAnthropic] = None
     ):
         """Initialize the agent.
 
@@ -49,6 +73,7 @@ class BaseAgent:
             model: Claude model to use
             temperature: Temperature for response generation
             max_tokens: Maximum tokens in response
+            client: Anthropic client to use (defaults to the shared client)
         """
         self.agent_id = agent_id
         self.callsign = callsign
@@ -71,12 +96,9 @@ class BaseAgent:
             "notes": []
         }
 
-        # Initialize Anthropic client
-        api_key = os.getenv("ANTHROPIC_API_KEY")
-        if not api_key:
-            raise ValueError("ANTHROPIC_API_KEY environment variable not set")
-
-        self.client = Anthropic(api_key=api_key)
+        # Use the shared Anthropic client unless one was injected
+        self._client_is_shared = client is None
+        self.client = client or get_shared_anthropic_client()
         self.protocol = VoiceNetProtocol()
 
         # Log initialization
@@ -165,7 +187,7 @@ class BaseAgent:
         if tools:
             api_params["tools"] = tools
 
-        response = self.client.messages.create(**api_params)
+        response = await self.client.messages.create(**api_params)
 
         # Tool use loop - continue until we get a text response
         while response.stop_reason == "tool_use":
@@ -205,7 +227,7 @@ class BaseAgent:
             if tools:
                 api_params["tools"] = tools
 
-            response = self.client.messages.create(**api_params)
+            response = await self.client.messages.create(**api_params)
 
         # Extract final text from response
         response_text = ""
@@ -1,5 +1,6 @@
 """Speaking criteria for determining when agents should respond."""
 
+import re
 from abc import ABC, abstractmethod
 from typing import List
 from enum import Enum
@@ -87,6 +88,14 @@ class KeywordCriteria(SpeakingCriteria):
         self.keywords = keywords
         self.case_sensitive = case_sensitive
 
+        # Compile the keyword list into one alternation so each message is
+        # scanned once by the regex engine instead of once per keyword.
+        # Plain substring semantics are preserved (no word boundaries).
+        self._pattern = re.compile(
+            "|".join(re.escape(keyword) for keyword in keywords),
+            flags=0 if case_sensitive else re.IGNORECASE
+        ) if keywords else None
+
     def should_respond(
         self,
         agent_id: str,
@@ -113,16 +122,10 @@ class KeywordCriteria(SpeakingCriteria):
         if latest.sender_id == agent_id:
             return False
 
-        content = latest.content
-        if not self.case_sensitive:
-            content = content.lower()
-
-        for keyword in self.keywords:
-            check_keyword = keyword if self.case_sensitive else keyword.lower()
-            if check_keyword in content:
-                return True
+        if self._pattern is None:
+            return False
 
-        return False
+        return self._pattern.search(latest.content) is not None
 
 
 class QuestionCriteria(SpeakingCriteria):
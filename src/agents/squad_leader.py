@@ -2,6 +2,8 @@
 
 from typing import Optional
 
+from anthropic import AsyncAnthropic
+
 from .base_agent import BaseAgent
 from .speaking_criteria import SquadLeaderCriteria, CompositeCriteria, DirectAddressCriteria
 from ..mcp.mcp_manager import MCPManager
@@ -25,7 +27,8 @@ class SquadLeaderAgent(BaseAgent):
         mcp_manager: Optional[MCPManager] = None,
         model: str = "claude-sonnet-4-5-20250929",
         temperature: float = 1.0,
-        max_tokens: int = 1024
+        max_tokens: int = 1024,
+        client: Optional[AsyncAnthropic] = None
     ):
         """Initialize the squad leader agent.
 
@@ -37,6 +40,7 @@ class SquadLeaderAgent(BaseAgent):
             model: Claude model to use
             temperature: Temperature for response generation
             max_tokens: Maximum tokens in response
+            client: Anthropic client to use (defaults to the shared client)
         """
         # Use default squad leader prompt if not provided
         if system_prompt is None:
@@ -56,7 +60,8 @@ class SquadLeaderAgent(BaseAgent):
             mcp_manager=mcp_manager,
             model=model,
             temperature=temperature,
-            max_tokens=max_tokens
+            max_tokens=max_tokens,
+            client=client
         )
 
     def _default_squad_leader_prompt(self) -> str:
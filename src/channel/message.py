@@ -6,6 +6,10 @@ from typing import Optional
 from pydantic import BaseModel, Field
 
 
+# Broadcast recipients, pre-lowered for is_addressed_to
+_BROADCAST_RECIPIENTS = frozenset({"all", "all units", "everyone"})
+
+
 class MessageType(str, Enum):
     """Types of messages in the system."""
 
@@ -54,11 +58,13 @@ class Message(BaseModel):
         if not self.recipient_callsign:
             return False
 
+        recipient = self.recipient_callsign.lower()
+
         # Handle broadcasts ("All units" or similar)
-        if self.recipient_callsign.lower() in ["all", "all units", "everyone"]:
+        if recipient in _BROADCAST_RECIPIENTS:
             return True
 
-        return self.recipient_callsign.lower() == callsign.lower()
+        return recipient == callsign.lower()
 
     def format_for_display(self) -> str:
         """Format the message for display in the channel.
@@ -1,11 +1,16 @@
 """Shared communication channel for multi-agent collaboration."""
 
-from typing import List, Optional
+import asyncio
+from operator import attrgetter
+from typing import Iterator, List, Optional, Tuple
 from datetime import datetime, timedelta
 
 from .message import Message, MessageType
 from .voice_net_protocol import VoiceNetProtocol
 
+# Sender IDs excluded when displaying agent traffic
+_SYSTEM_SENDERS = frozenset({"user", "system"})
+
 
 class SharedChannel:
     """Central communication hub for agents and users.
@@ -20,9 +25,20 @@ class SharedChannel:
         Args:
             max_history: Maximum number of messages to keep in history
         """
+        # History is a plain list rather than a deque(maxlen=...): callers
+        # throughout the tree rely on slice access (messages[-count:]), and
+        # bounded memory is already guaranteed by the in-place del-slice
+        # trim in add_message/add_messages_bulk. List head indexing is O(1)
+        # either way.
         self.messages: List[Message] = []
         self.max_history = max_history
+        # Monotonic count of every message ever added, unaffected by the
+        # history trim (or clear); consumers that track their position in
+        # the stream (e.g. incremental persistence) anchor to this rather
+        # than to indices into the trimmed list
+        self.total_messages_added = 0
         self._protocol = VoiceNetProtocol()
+        self._new_message_event = asyncio.Event()
 
     def add_message(
         self,
@@ -58,13 +74,72 @@ class SharedChannel:
         )
 
         self.messages.append(message)
+        self.total_messages_added += 1
 
-        # Trim history if needed
+        # Trim history in place; avoids reallocating the whole list and
+        # keeps references to self.messages held by callers valid
         if len(self.messages) > self.max_history:
-            self.messages = self.messages[-self.max_history:]
+            del self.messages[:len(self.messages) - self.max_history]
+
+        # Wake any consumer blocked in wait_for_message
+        self._new_message_event.set()
 
         return message
 
+    def add_messages_bulk(self, entries: List[dict]) -> List[Message]:
+        """Add several messages to the channel in one pass.
+
+        Amortizes the history-trim check across the whole batch instead of
+        paying it per message, and appends with a single list extend.
+
+        Args:
+            entries: List of dicts accepting the same keys as add_message
+                (sender_id, content, sender_callsign, message_type, metadata)
+
+        Returns:
+            List of created Message objects, in input order
+        """
+        created = []
+        for entry in entries:
+            content = entry["content"]
+            parsed = self._protocol.parse(content)
+
+            created.append(Message(
+                sender_id=entry["sender_id"],
+                sender_callsign=entry.get("sender_callsign"),
+                recipient_callsign=parsed.recipient,
+                content=content,
+                message_type=entry.get("message_type", MessageType.AGENT),
+                metadata=entry.get("metadata") or {}
+            ))
+
+        self.messages.extend(created)
+        self.total_messages_added += len(created)
+
+        # Trim history once for the whole batch
+        if len(self.messages) > self.max_history:
+            del self.messages[:len(self.messages) - self.max_history]
+
+        if created:
+            self._new_message_event.set()
+
+        return created
+
+    async def wait_for_message(self) -> Message:
+        """Wait until a new message arrives and return the latest message.
+
+        Event-driven alternative to polling get_recent_messages in a loop:
+        consumers block on an asyncio.Event that add_message sets, so there
+        is no polling interval latency. If a message arrived since the last
+        wait, this returns immediately.
+
+        Returns:
+            The most recent message in the channel
+        """
+        await self._new_message_event.wait()
+        self._new_message_event.clear()
+        return self.messages[-1]
+
     def get_recent_messages(self, count: int = 10) -> List[Message]:
         """Get the most recent messages.
 
@@ -76,6 +151,45 @@ class SharedChannel:
         """
         return self.messages[-count:] if self.messages else []
 
+    def iter_recent_non_system(self, count: int = 10) -> Iterator[Message]:
+        """Iterate over recent messages, skipping user and system traffic.
+
+        Walks the message tail once without building an intermediate list,
+        which keeps display loops cheap for callers that only want agent
+        messages.
+
+        Args:
+            count: Number of recent messages to consider
+
+        Yields:
+            Recent messages not sent by the user or the system
+        """
+        for msg in self.messages[-count:]:
+            if msg.sender_id not in _SYSTEM_SENDERS:
+                yield msg
+
+    def get_recent_projection(
+        self,
+        count: int = 10,
+        fields: Tuple[str, ...] = ("sender_id", "sender_callsign", "content")
+    ) -> Iterator[tuple]:
+        """Yield selected fields of recent messages as tuples.
+
+        For consumers that only need a couple of attributes (display
+        loops, logging), this avoids handing out whole Message objects
+        and repeating the attribute lookups at every use site.
+
+        Args:
+            count: Number of recent messages to consider
+            fields: Message attribute names to project (two or more)
+
+        Yields:
+            One tuple per recent message, values in field order
+        """
+        getter = attrgetter(*fields)
+        for msg in self.messages[-count:]:
+            yield getter(msg)
+
     def get_messages_since(self, timestamp: datetime) -> List[Message]:
         """Get all messages since a specific timestamp.
 
@@ -182,8 +296,4 @@ class SharedChannel:
         if not recent:
             return "No messages in channel."
 
-        lines = []
-        for msg in recent:
-            lines.append(msg.format_for_display())
-
-        return "\n".join(lines)
+        return "\n".join(msg.format_for_display() for msg in recent)
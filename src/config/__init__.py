@@ -8,8 +8,11 @@ from .schema import (
     SpeakingCriteriaConfig
 )
 from .loader import ConfigLoader, load_config
+from .paths import AEROSPACE_MCP_PATH, HAS_MCP
 
 __all__ = [
+    'AEROSPACE_MCP_PATH',
+    'HAS_MCP',
     'AgentConfig',
     'ChannelConfig',
     'OrchestrationConfig',
@@ -0,0 +1,18 @@
+"""Filesystem locations shared across demos and tooling.
+
+Resolved once at import so each consumer reuses the same Path object and
+existence check instead of rebuilding them (and re-statting the
+directory) at every call site.
+"""
+
+from pathlib import Path
+
+# Repository root (the directory containing src/)
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# The aerospace-mcp server checkout is expected as a sibling of this repo
+AEROSPACE_MCP_PATH: Path = _REPO_ROOT.parent / "aerospace-mcp"
+
+# Whether the server checkout is present; demos use this to decide
+# between MCP-backed and mock operation
+HAS_MCP: bool = AEROSPACE_MCP_PATH.exists()
@@ -2,6 +2,7 @@
 
 import asyncio
 import json
+import time
 from typing import Dict, List, Optional, Any
 from contextlib import AsyncExitStack
 from mcp import ClientSession, StdioServerParameters
@@ -36,6 +37,11 @@ class MCPManager:
         """Initialize the MCP manager."""
         self.sessions: Dict[str, ClientSession] = {}
         self.tools_cache: Dict[str, List[Dict[str, Any]]] = {}
+        self._all_tools_cache: Optional[List[Dict[str, Any]]] = None
+        self._connect_locks: Dict[str, asyncio.Lock] = {}
+        # (server, tool, serialized args) -> (monotonic timestamp, result)
+        # for call_tool_cached
+        self._call_cache: Dict[tuple, tuple] = {}
         self.exit_stack = AsyncExitStack()
         self._initialized = False
         self.circuit_breaker_manager = get_circuit_breaker_manager()
@@ -70,6 +76,25 @@ class MCPManager:
         Raises:
             MCPConnectionError: If connection fails after retries
         """
+        # Serialize connection attempts per server so concurrent callers
+        # can't double-spawn the same subprocess; already-connected servers
+        # are reused rather than respawned.
+        lock = self._connect_locks.setdefault(server_name, asyncio.Lock())
+        async with lock:
+            if server_name in self.sessions:
+                logger.debug(f"MCP server already connected, reusing: {server_name}")
+                return True
+
+            return await self._connect_server_locked(server_name, command, args, env)
+
+    async def _connect_server_locked(
+        self,
+        server_name: str,
+        command: str,
+        args: List[str],
+        env: Optional[Dict[str, str]] = None
+    ) -> bool:
+        """Establish a new server connection. Caller must hold the connect lock."""
         logger.info(f"Connecting to MCP server: {server_name}")
 
         try:
@@ -153,6 +178,7 @@ class MCPManager:
                 }
                 for tool in tools_response.tools
             ]
+            self.invalidate_tools_cache()
 
             logger.info(f"Discovered {len(self.tools_cache[server_name])} tools from {server_name}")
 
@@ -183,11 +209,18 @@ class MCPManager:
         if server_name:
             return self.tools_cache.get(server_name, [])
 
-        # Return all tools from all servers
-        all_tools = []
-        for tools in self.tools_cache.values():
-            all_tools.extend(tools)
-        return all_tools
+        # Return all tools from all servers (memoized: agents rebuild their
+        # tool list every turn, so avoid re-concatenating each time)
+        if self._all_tools_cache is None:
+            all_tools = []
+            for tools in self.tools_cache.values():
+                all_tools.extend(tools)
+            self._all_tools_cache = all_tools
+        return self._all_tools_cache
+
+    def invalidate_tools_cache(self):
+        """Invalidate the aggregated tool list after discovery or disconnect."""
+        self._all_tools_cache = None
 
     def get_tool_info(self, tool_name: str) -> Optional[Dict[str, Any]]:
         """Get information about a specific tool.
@@ -300,11 +333,52 @@ class MCPManager:
                 }
             )
 
+    async def call_tool_cached(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any],
+        server_name: Optional[str] = None,
+        timeout: float = 30.0,
+        ttl_seconds: float = 60.0
+    ) -> Optional[Any]:
+        """Call an MCP tool, reusing a recent result for identical calls.
+
+        Suits read-only tools whose upstream data changes on a known
+        cadence (METAR roughly every minute, TAF every ten, station info
+        daily): a repeat call with the same arguments inside ttl_seconds
+        returns the cached result with no subprocess round-trip.
+
+        Args:
+            tool_name: Name of the tool to call
+            arguments: Tool arguments
+            server_name: Optional server name
+            timeout: Operation timeout in seconds
+            ttl_seconds: How long a cached result stays valid
+
+        Returns:
+            Tool result (possibly cached)
+        """
+        key = (server_name, tool_name, json.dumps(arguments, sort_keys=True))
+        cached = self._call_cache.get(key)
+        now = time.monotonic()
+
+        if cached is not None and now - cached[0] < ttl_seconds:
+            logger.debug(f"Cache hit for tool '{tool_name}' ({arguments})")
+            return cached[1]
+
+        result = await self.call_tool(
+            tool_name, arguments, server_name=server_name, timeout=timeout
+        )
+        self._call_cache[key] = (now, result)
+        return result
+
     async def close(self):
         """Close all server connections."""
         await self.exit_stack.aclose()
         self.sessions.clear()
         self.tools_cache.clear()
+        self._call_cache.clear()
+        self.invalidate_tools_cache()
         self._initialized = False
 
     async def cleanup(self):
@@ -477,24 +551,33 @@ async def initialize_all_aviation_mcps(
     Returns:
         Dictionary mapping server names to connection success status
     """
-    results = {}
+    pending = []
 
     if aerospace_path:
-        results["aerospace-mcp"] = await initialize_aerospace_mcp(aerospace_path, env)
+        pending.append(("aerospace-mcp", initialize_aerospace_mcp(aerospace_path, env)))
 
     if aviation_weather_path:
-        results["aviation-weather-mcp"] = await initialize_aviation_weather_mcp(
-            aviation_weather_path, env
-        )
+        pending.append((
+            "aviation-weather-mcp",
+            initialize_aviation_weather_mcp(aviation_weather_path, env)
+        ))
 
     if blevinstein_aviation_path:
-        results["blevinstein-aviation-mcp"] = await initialize_blevinstein_aviation_mcp(
-            blevinstein_aviation_path, env
-        )
+        pending.append((
+            "blevinstein-aviation-mcp",
+            initialize_blevinstein_aviation_mcp(blevinstein_aviation_path, env)
+        ))
 
     if aircraft_sim_path:
-        results["aircraft-sim-mcp"] = await initialize_aircraft_sim_mcp(
-            aircraft_sim_path, env
-        )
+        pending.append(("aircraft-sim-mcp", initialize_aircraft_sim_mcp(aircraft_sim_path, env)))
+
+    if not pending:
+        return {}
+
+    # Connect concurrently: startup cost is dominated by subprocess spawn
+    # and stdio JSON-RPC handshakes, so overlapping them collapses wall
+    # time to the slowest server instead of the sum. Each helper already
+    # converts connection failures into a False status.
+    statuses = await asyncio.gather(*(coro for _, coro in pending))
 
-    return results
+    return {name: ok for (name, _), ok in zip(pending, statuses)}
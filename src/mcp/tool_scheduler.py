@@ -0,0 +1,124 @@
+"""Concurrency scheduling for MCP tool calls shared across agents."""
+
+import asyncio
+from typing import Dict, List, Optional, Any
+
+from .mcp_manager import MCPManager
+
+
+class ToolScheduler:
+    """Schedules tool calls from multiple agents across MCP servers.
+
+    Exposes the same surface agents use on MCPManager (is_initialized,
+    get_available_tools, get_tool_info, call_tool, cleanup), so it can
+    be passed anywhere a manager is expected. Calls targeting different
+    servers proceed in parallel, while calls to the same server share a
+    bounded semaphore so a burst of agents cannot saturate one stdio
+    session.
+    """
+
+    def __init__(self, manager: MCPManager, max_concurrent: int = 8):
+        """Initialize the scheduler.
+
+        Args:
+            manager: Underlying MCP manager to delegate to
+            max_concurrent: Maximum in-flight tool calls per server
+        """
+        self.manager = manager
+        self.max_concurrent = max_concurrent
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def is_initialized(self) -> bool:
+        """Check if the underlying manager is initialized.
+
+        Returns:
+            True if initialized
+        """
+        return self.manager.is_initialized()
+
+    def get_available_tools(self, server_name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get list of available tools.
+
+        Args:
+            server_name: Optional server to get tools from
+
+        Returns:
+            List of tool definitions
+        """
+        return self.manager.get_available_tools(server_name)
+
+    def get_tool_info(self, tool_name: str) -> Optional[Dict[str, Any]]:
+        """Get information about a specific tool.
+
+        Args:
+            tool_name: Name of the tool
+
+        Returns:
+            Tool information or None if not found
+        """
+        return self.manager.get_tool_info(tool_name)
+
+    def _resolve_server(self, tool_name: str, server_name: Optional[str]) -> Optional[str]:
+        """Determine which server a tool call will land on.
+
+        Args:
+            tool_name: Name of the tool to call
+            server_name: Explicit server, if the caller supplied one
+
+        Returns:
+            Server name, or None if the tool is unknown
+        """
+        if server_name:
+            return server_name
+
+        for srv_name, tools in self.manager.tools_cache.items():
+            if any(tool["name"] == tool_name for tool in tools):
+                return srv_name
+
+        return None
+
+    async def call_tool(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any],
+        server_name: Optional[str] = None,
+        timeout: float = 30.0
+    ) -> Optional[Any]:
+        """Call an MCP tool under the target server's concurrency bound.
+
+        Args:
+            tool_name: Name of the tool to call
+            arguments: Tool arguments
+            server_name: Optional server name
+            timeout: Operation timeout in seconds
+
+        Returns:
+            Tool result
+
+        Raises:
+            ToolNotFoundError: If tool doesn't exist
+            ToolExecutionError: If tool execution fails
+        """
+        target = self._resolve_server(tool_name, server_name)
+        if target is None:
+            # Unknown tool: delegate directly so the manager raises its
+            # usual ToolNotFoundError with full context
+            return await self.manager.call_tool(
+                tool_name, arguments, server_name=server_name, timeout=timeout
+            )
+
+        semaphore = self._semaphores.setdefault(
+            target, asyncio.Semaphore(self.max_concurrent)
+        )
+        async with semaphore:
+            return await self.manager.call_tool(
+                tool_name, arguments, server_name=target, timeout=timeout
+            )
+
+    async def close(self):
+        """Close the underlying manager's connections."""
+        await self.manager.close()
+
+    async def cleanup(self):
+        """Alias for close() for convenience."""
+        await self.close()
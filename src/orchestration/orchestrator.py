@@ -1,9 +1,12 @@
 """Orchestrator for managing multi-agent collaboration."""
 
 import asyncio
+import sys
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
+from anthropic import AsyncAnthropic
+
 from ..agents.base_agent import BaseAgent
 from ..agents.squad_leader import SquadLeaderAgent
 from ..channel.shared_channel import SharedChannel
@@ -25,7 +28,8 @@ class Orchestrator:
         self,
         channel: Optional[SharedChannel] = None,
         max_agents: int = 6,
-        context_window: int = 20
+        context_window: int = 20,
+        anthropic_client: Optional[AsyncAnthropic] = None
     ):
         """Initialize the orchestrator.
 
@@ -33,9 +37,15 @@ class Orchestrator:
             channel: Shared channel for communication (creates new if not provided)
             max_agents: Maximum number of agents (excluding user)
             context_window: Number of messages for agent context
+            anthropic_client: Optional client injected into agents on
+                add_agent so the whole roster shares one connection pool
         """
         self.channel = channel or SharedChannel()
+        self.anthropic_client = anthropic_client
         self.agents: Dict[str, BaseAgent] = {}
+        # Normalized callsign -> agent, maintained on add/remove so directed
+        # messages resolve in O(1) instead of scanning the roster
+        self._callsign_index: Dict[str, BaseAgent] = {}
         self.squad_leader: Optional[SquadLeaderAgent] = None
         self.max_agents = max_agents
         self.context_window = context_window
@@ -53,7 +63,13 @@ class Orchestrator:
         if len(self.agents) >= self.max_agents:
             return False
 
+        # Inject the orchestrator's client into agents still using the
+        # shared default, so the roster multiplexes one connection pool
+        if self.anthropic_client is not None and getattr(agent, "_client_is_shared", False):
+            agent.client = self.anthropic_client
+
         self.agents[agent.agent_id] = agent
+        self._callsign_index[self._normalize_callsign(agent.callsign)] = agent
 
         # Track squad leader separately
         if isinstance(agent, SquadLeaderAgent):
@@ -82,6 +98,7 @@ class Orchestrator:
 
         agent = self.agents[agent_id]
         del self.agents[agent_id]
+        self._callsign_index.pop(self._normalize_callsign(agent.callsign), None)
 
         # Clear squad leader if removed
         if self.squad_leader and self.squad_leader.agent_id == agent_id:
@@ -126,13 +143,20 @@ class Orchestrator:
     async def process_responses(
         self,
         max_responses: int = 3,
-        timeout_seconds: float = 30.0
+        timeout_seconds: float = 30.0,
+        last_message: Optional[Message] = None
     ) -> List[Message]:
         """Process agent responses with directed communication support.
 
+        Each agent's response is bounded by its own timeout, so one stuck
+        agent costs at most timeout_seconds and the others still deliver:
+        the turn degrades to partial results instead of failing wholesale.
+
         Args:
             max_responses: Maximum number of agents to respond
-            timeout_seconds: Timeout for response generation
+            timeout_seconds: Per-agent timeout for response generation
+            last_message: The message opening this turn, if the caller
+                already holds it; avoids re-reading the channel tail
 
         Returns:
             List of messages generated by agents
@@ -140,14 +164,18 @@ class Orchestrator:
         responses = []
         responding_agents = []
 
-        # Get the most recent message to check for directed communication
-        recent_messages = self.channel.get_recent_messages(1)
-        if recent_messages:
-            last_message = recent_messages[0]
+        # The caller usually just posted the turn-opening message and hands
+        # it over directly; fall back to the channel tail otherwise
+        if last_message is None:
+            recent_messages = self.channel.get_recent_messages(1)
+            last_message = recent_messages[0] if recent_messages else None
 
+        if last_message is not None:
             # Check if message is directed to specific agent
             if last_message.recipient_callsign and last_message.recipient_callsign.upper() != "ALL":
-                # Directed message - find the recipient agent
+                # Directed message - find the recipient agent. This is the
+                # single-specialist fast path: the callsign index resolves
+                # the target in O(1) and no other agent is polled.
                 target_agent = self._find_agent_by_callsign(last_message.recipient_callsign)
 
                 if target_agent:
@@ -168,21 +196,37 @@ class Orchestrator:
                 # If no agents want to respond and we have a squad leader, they respond
                 if not responding_agents and self.squad_leader:
                     responding_agents.append(self.squad_leader)
-        else:
-            # No messages - shouldn't happen, but handle gracefully
-            pass
 
-        # Generate responses (now async)
+        # Generate responses (now async). Sequential on purpose: later
+        # responders read earlier responses from the channel within the
+        # same turn.
         for agent in responding_agents:
             try:
-                message = await agent.respond(self.channel, self.context_window)
+                message = await asyncio.wait_for(
+                    agent.respond(self.channel, self.context_window),
+                    timeout=timeout_seconds
+                )
                 if message:
                     responses.append(message)
+            except asyncio.TimeoutError:
+                print(f"Response from {agent.callsign} timed out after {timeout_seconds:.0f}s")
             except Exception as e:
                 print(f"Error processing response from {agent.callsign}: {e}")
 
         return responses
 
+    @staticmethod
+    def _normalize_callsign(callsign: str) -> str:
+        """Normalize a callsign for case/separator-insensitive comparison.
+
+        Args:
+            callsign: Raw callsign
+
+        Returns:
+            Normalized callsign key
+        """
+        return callsign.upper().replace("-", " ").replace("_", " ")
+
     def _find_agent_by_callsign(self, callsign: str) -> Optional[BaseAgent]:
         """Find an agent by their callsign.
 
@@ -192,25 +236,21 @@ class Orchestrator:
         Returns:
             Matching agent or None
         """
-        callsign_normalized = callsign.upper().replace("-", " ").replace("_", " ")
-
-        for agent in self.agents.values():
-            agent_callsign = agent.callsign.upper().replace("-", " ").replace("_", " ")
-            if agent_callsign == callsign_normalized:
-                return agent
-
-        return None
+        return self._callsign_index.get(self._normalize_callsign(callsign))
 
     async def run_turn(
         self,
         user_message: Optional[str] = None,
-        max_agent_responses: int = 3
+        max_agent_responses: int = 3,
+        response_timeout: float = 30.0
     ) -> Dict[str, Any]:
         """Run a single turn of the collaboration.
 
         Args:
             user_message: Optional user message to start the turn
             max_agent_responses: Maximum number of agent responses
+            response_timeout: Per-agent response timeout in seconds; a
+                stuck agent is skipped rather than failing the whole turn
 
         Returns:
             Dict with turn results
@@ -227,11 +267,50 @@ class Orchestrator:
             turn_data["user_message"] = msg
 
         # Process agent responses (now async)
-        responses = await self.process_responses(max_responses=max_agent_responses)
+        responses = await self.process_responses(
+            max_responses=max_agent_responses,
+            timeout_seconds=response_timeout,
+            last_message=turn_data["user_message"]
+        )
         turn_data["agent_responses"] = responses
 
         return turn_data
 
+    async def run_turn_and_report(
+        self,
+        user_message: Optional[str] = None,
+        max_agent_responses: int = 3,
+        out=None
+    ) -> List[Message]:
+        """Run a turn and write the agent responses it produced.
+
+        Replaces the slice-and-filter display pattern at call sites: the
+        responses come straight from the turn data, so no channel tail scan
+        or sender filtering is needed, and the report is emitted with a
+        single write.
+
+        Args:
+            user_message: Optional user message to start the turn
+            max_agent_responses: Maximum number of agent responses
+            out: Writable stream for the report (defaults to sys.stdout)
+
+        Returns:
+            List of messages generated by agents this turn
+        """
+        turn_data = await self.run_turn(
+            user_message=user_message,
+            max_agent_responses=max_agent_responses
+        )
+        responses = turn_data["agent_responses"]
+
+        if responses:
+            stream = out or sys.stdout
+            stream.write("".join(
+                f"[{msg.sender_callsign}] {msg.content}\n\n" for msg in responses
+            ))
+
+        return responses
+
     def get_active_agents(self) -> List[BaseAgent]:
         """Get list of all active agents.
 
@@ -0,0 +1,5 @@
+"""State persistence module for multi-agent collaboration sessions."""
+
+from .state_manager import StateManager
+
+__all__ = ['StateManager']
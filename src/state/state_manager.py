@@ -0,0 +1,486 @@
+"""Session persistence for multi-agent collaboration.
+
+Saves and restores collaboration sessions (channel history, agent memory,
+and metadata) to a local SQLite database, one row per session.
+
+Serialization is split by payload shape: the channel history — the bulk
+of a long session — is pickled with protocol 5, while metadata and agent
+states go through orjson, which is several times faster than the stdlib
+json module and produces bytes directly.
+"""
+
+import asyncio
+import contextlib
+import json
+import pickle
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import aiosqlite
+import orjson
+
+from ..channel.message import Message, MessageType
+from ..channel.shared_channel import SharedChannel
+
+
+class StateManager:
+    """Persists and restores collaboration sessions.
+
+    The state manager:
+    - Saves channel history, agent memory, and session metadata
+    - Loads saved sessions for resumption
+    - Lists, deletes, and exports sessions
+    """
+
+    def __init__(self, db_path: str = "data/sessions.db"):
+        """Initialize the state manager.
+
+        Args:
+            db_path: Path to the SQLite database file (parent directories
+                are created if needed)
+        """
+        self.db_path = db_path
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        # Per-session count of messages already in the incremental log
+        # (in channel total_messages_added terms), so each persist pass
+        # serializes only the new tail
+        self._log_positions: Dict[str, int] = {}
+        self._autosave_task: Optional[asyncio.Task] = None
+        self._autosave_args: Optional[tuple] = None
+
+    async def initialize_db(self):
+        """Create the sessions table and configure journaling.
+
+        The pragmas and DDL go through one executescript round trip.
+        WAL journaling (a persistent property of the database file) lets
+        readers run concurrently with a writer and turns the per-commit
+        fsync into a cheaper WAL append; synchronous=NORMAL is the
+        recommended pairing for it.
+        """
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.executescript(
+                """
+                PRAGMA journal_mode=WAL;
+                PRAGMA synchronous=NORMAL;
+                CREATE TABLE IF NOT EXISTS sessions (
+                    session_id TEXT PRIMARY KEY,
+                    created_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    message_count INTEGER NOT NULL,
+                    agent_count INTEGER NOT NULL,
+                    messages BLOB NOT NULL,
+                    agent_states BLOB NOT NULL,
+                    metadata BLOB NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS session_messages (
+                    session_id TEXT NOT NULL,
+                    seq INTEGER NOT NULL,
+                    message BLOB NOT NULL,
+                    PRIMARY KEY (session_id, seq)
+                );
+                """
+            )
+
+    async def save_session(
+        self,
+        session_id: str,
+        channel: SharedChannel,
+        agents: List[Any],
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """Save a session, updating it if the session_id already exists.
+
+        Args:
+            session_id: Unique session identifier
+            channel: Shared channel whose history should be persisted
+            agents: Agents whose state should be persisted
+            metadata: Optional session metadata
+
+        Returns:
+            True if the session was saved
+        """
+        try:
+            now = datetime.now().isoformat()
+
+            message_dicts = [self._message_to_dict(msg) for msg in channel.messages]
+            # Channel history dominates the payload for long sessions;
+            # pickle protocol 5 serializes it in one pass without the
+            # per-field encoding cost of a JSON round-trip
+            messages_blob = pickle.dumps(message_dicts, protocol=5)
+            agent_states_blob = orjson.dumps(
+                [self._agent_to_state(agent) for agent in agents]
+            )
+            metadata_blob = orjson.dumps(metadata or {})
+
+            async with aiosqlite.connect(self.db_path) as db:
+                await db.execute(
+                    """
+                    INSERT INTO sessions (
+                        session_id, created_at, updated_at,
+                        message_count, agent_count,
+                        messages, agent_states, metadata
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(session_id) DO UPDATE SET
+                        updated_at = excluded.updated_at,
+                        message_count = excluded.message_count,
+                        agent_count = excluded.agent_count,
+                        messages = excluded.messages,
+                        agent_states = excluded.agent_states,
+                        metadata = excluded.metadata
+                    """,
+                    (
+                        session_id, now, now,
+                        len(message_dicts), len(agents),
+                        messages_blob, agent_states_blob, metadata_blob
+                    )
+                )
+                await db.commit()
+
+            return True
+
+        except Exception as e:
+            print(f"Error saving session {session_id}: {e}")
+            return False
+
+    async def persist_new_messages(
+        self,
+        session_id: str,
+        channel: SharedChannel
+    ) -> int:
+        """Append messages posted since the last persist to the log.
+
+        Unlike save_session, which re-serializes the whole history as one
+        snapshot, this writes only the new tail — one row per message —
+        so per-call cost stays proportional to traffic since the last
+        call, not to session length. WAL journaling makes each batch a
+        cheap log append.
+
+        Args:
+            session_id: Session the messages belong to
+            channel: Channel to read new messages from
+
+        Returns:
+            Number of messages persisted
+        """
+        # Positions count messages ever added, not list indices: the
+        # channel trims (and can clear) self.messages in place, so slicing
+        # by a stored index would skip or re-read messages once history
+        # shifts. The trim offset maps the position back into the live
+        # list; anything older than the offset is gone from memory and
+        # cannot be persisted now.
+        total = channel.total_messages_added
+        offset = total - len(channel.messages)
+        start = max(min(self._log_positions.get(session_id, 0), total), offset)
+        new_messages = channel.messages[start - offset:]
+        if not new_messages:
+            return 0
+
+        rows = [
+            (session_id, start + i, pickle.dumps(self._message_to_dict(msg), protocol=5))
+            for i, msg in enumerate(new_messages)
+        ]
+
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.executemany(
+                "INSERT OR REPLACE INTO session_messages (session_id, seq, message)"
+                " VALUES (?, ?, ?)",
+                rows
+            )
+            await db.commit()
+
+        self._log_positions[session_id] = start + len(new_messages)
+        return len(new_messages)
+
+    def start_autosave(self, session_id: str, channel: SharedChannel) -> asyncio.Task:
+        """Stream channel messages into the log as they arrive.
+
+        Starts a background task that blocks on the channel's new-message
+        event and persists the new tail after each wakeup, so session
+        history is durable throughout the run instead of only at exit.
+
+        Args:
+            session_id: Session the messages belong to
+            channel: Channel to watch
+
+        Returns:
+            The background autosave task
+        """
+        self._autosave_args = (session_id, channel)
+        self._autosave_task = asyncio.create_task(
+            self._autosave_loop(session_id, channel)
+        )
+        return self._autosave_task
+
+    async def stop_autosave(self):
+        """Stop the autosave task and flush any unpersisted messages."""
+        if self._autosave_task is None:
+            return
+
+        self._autosave_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._autosave_task
+        self._autosave_task = None
+
+        session_id, channel = self._autosave_args
+        self._autosave_args = None
+        await self.persist_new_messages(session_id, channel)
+
+    async def _autosave_loop(self, session_id: str, channel: SharedChannel):
+        """Persist new messages whenever the channel signals arrivals.
+
+        Args:
+            session_id: Session the messages belong to
+            channel: Channel to watch
+        """
+        while True:
+            await channel.wait_for_message()
+            try:
+                await self.persist_new_messages(session_id, channel)
+            except Exception as e:
+                print(f"Error persisting messages for {session_id}: {e}")
+
+    async def load_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Load a saved session.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            Session data dict with messages, agent_states, and metadata,
+            or None if the session does not exist
+        """
+        async with aiosqlite.connect(self.db_path) as db:
+            cursor = await db.execute(
+                """
+                SELECT session_id, created_at, updated_at,
+                       messages, agent_states, metadata
+                FROM sessions WHERE session_id = ?
+                """,
+                (session_id,)
+            )
+            row = await cursor.fetchone()
+
+        if row is None:
+            return None
+
+        return {
+            "session_id": row[0],
+            "created_at": row[1],
+            "updated_at": row[2],
+            "messages": pickle.loads(row[3]),
+            "agent_states": orjson.loads(row[4]),
+            "metadata": orjson.loads(row[5])
+        }
+
+    async def list_sessions(self, limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
+        """List saved sessions, most recently updated first.
+
+        Args:
+            limit: Maximum number of sessions to return
+            offset: Number of sessions to skip
+
+        Returns:
+            List of session summary dicts
+        """
+        async with aiosqlite.connect(self.db_path) as db:
+            cursor = await db.execute(
+                """
+                SELECT session_id, created_at, updated_at,
+                       message_count, agent_count
+                FROM sessions
+                ORDER BY updated_at DESC
+                LIMIT ? OFFSET ?
+                """,
+                (limit, offset)
+            )
+            rows = await cursor.fetchall()
+
+        return [
+            {
+                "session_id": row[0],
+                "created_at": row[1],
+                "updated_at": row[2],
+                "message_count": row[3],
+                "agent_count": row[4]
+            }
+            for row in rows
+        ]
+
+    async def delete_session(self, session_id: str) -> bool:
+        """Delete a saved session.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            True (deleting a nonexistent session is not an error)
+        """
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.execute(
+                "DELETE FROM sessions WHERE session_id = ?",
+                (session_id,)
+            )
+            await db.commit()
+
+        return True
+
+    async def restore_channel(self, session_data: Dict[str, Any]) -> SharedChannel:
+        """Rebuild a shared channel from loaded session data.
+
+        Messages are reconstructed directly from their stored dicts, so
+        recipient parsing and timestamps are preserved exactly as saved.
+
+        Args:
+            session_data: Session data from load_session
+
+        Returns:
+            Channel populated with the session's message history
+        """
+        channel = SharedChannel()
+        channel.messages.extend(
+            self._dict_to_message(msg_dict)
+            for msg_dict in session_data.get("messages", [])
+        )
+        return channel
+
+    def restore_agent_memory(self, agent: Any, agent_state: Dict[str, Any]):
+        """Restore an agent's memory from a saved agent state.
+
+        Args:
+            agent: Agent to restore memory into
+            agent_state: Saved state dict (from load_session agent_states)
+        """
+        memory = agent_state.get("memory")
+        if memory:
+            agent.memory.update(memory)
+
+    async def export_session(
+        self,
+        session_id: str,
+        export_path: str,
+        format: str = "json"
+    ) -> bool:
+        """Export a session to a file.
+
+        Args:
+            session_id: Session identifier
+            export_path: Destination file path
+            format: Export format, "json" or "txt"
+
+        Returns:
+            True if the session was exported
+        """
+        session_data = await self.load_session(session_id)
+        if session_data is None:
+            return False
+
+        try:
+            if format == "txt":
+                with open(export_path, 'w') as f:
+                    f.write(self._format_session_text(session_data))
+            else:
+                with open(export_path, 'wb') as f:
+                    f.write(orjson.dumps(session_data, option=orjson.OPT_INDENT_2))
+
+            return True
+
+        except Exception as e:
+            print(f"Error exporting session {session_id}: {e}")
+            return False
+
+    def _format_session_text(self, session_data: Dict[str, Any]) -> str:
+        """Format a session as a readable transcript.
+
+        Args:
+            session_data: Session data from load_session
+
+        Returns:
+            Human-readable session transcript
+        """
+        lines = [
+            f"Session: {session_data['session_id']}",
+            f"Created: {session_data['created_at']}",
+            f"Updated: {session_data['updated_at']}",
+            "",
+            "=== Transcript ===",
+        ]
+
+        for msg in session_data.get("messages", []):
+            sender = msg.get("sender_callsign") or msg.get("sender_id")
+            lines.append(f"[{msg.get('timestamp', '')}] {sender}: {msg['content']}")
+
+        lines.append("")
+        lines.append("=== Agents ===")
+        for state in session_data.get("agent_states", []):
+            lines.append(f"{state.get('callsign')} ({state.get('agent_type')})")
+
+        if session_data.get("metadata"):
+            lines.append("")
+            lines.append("=== Metadata ===")
+            lines.append(json.dumps(session_data["metadata"], indent=2, default=str))
+
+        return "\n".join(lines) + "\n"
+
+    def _agent_to_state(self, agent: Any) -> Dict[str, Any]:
+        """Convert an agent to a serializable state dict.
+
+        Args:
+            agent: Agent to serialize
+
+        Returns:
+            Serializable agent state
+        """
+        return {
+            "agent_id": agent.agent_id,
+            "callsign": agent.callsign,
+            "agent_type": agent.get_agent_type(),
+            "system_prompt": getattr(agent, "system_prompt", None),
+            "model": getattr(agent, "model", None),
+            "memory": agent.memory
+        }
+
+    def _message_to_dict(self, message: Message) -> Dict[str, Any]:
+        """Convert a Message to a serializable dict.
+
+        Args:
+            message: Message to convert
+
+        Returns:
+            Serializable message dict
+        """
+        return {
+            "id": message.id,
+            "timestamp": message.timestamp.isoformat(),
+            "sender_id": message.sender_id,
+            "sender_callsign": message.sender_callsign,
+            "recipient_callsign": message.recipient_callsign,
+            "content": message.content,
+            "message_type": message.message_type.value,
+            "metadata": message.metadata
+        }
+
+    def _dict_to_message(self, msg_dict: Dict[str, Any]) -> Message:
+        """Convert a stored dict back into a Message.
+
+        Args:
+            msg_dict: Serialized message dict
+
+        Returns:
+            Reconstructed Message
+        """
+        fields = {
+            "sender_id": msg_dict["sender_id"],
+            "sender_callsign": msg_dict.get("sender_callsign"),
+            "recipient_callsign": msg_dict.get("recipient_callsign"),
+            "content": msg_dict["content"],
+            "message_type": MessageType(msg_dict.get("message_type", "agent")),
+            "metadata": msg_dict.get("metadata") or {}
+        }
+
+        if msg_dict.get("id"):
+            fields["id"] = msg_dict["id"]
+        if msg_dict.get("timestamp"):
+            fields["timestamp"] = datetime.fromisoformat(msg_dict["timestamp"])
+
+        return Message(**fields)
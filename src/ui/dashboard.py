@@ -38,6 +38,9 @@ class Dashboard:
         self.mission_data = {}
         self.agents = []
         self.start_time = datetime.now()
+        # Set when the view content changes; lets a host drive redraws
+        # only when something is actually pending instead of on a timer
+        self._dirty = True
 
         # Create layout structure
         self._create_layout()
@@ -272,6 +275,30 @@ class Dashboard:
             message: Message to add
         """
         self.messages.append(message)
+        self._dirty = True
+
+    def add_messages(self, messages: List[Message]):
+        """Add several messages to the display in a single append.
+
+        Mutates the underlying deque once instead of per message, so a
+        whole turn's worth of messages lands between refreshes of a live
+        view rather than interleaving with them.
+
+        Args:
+            messages: Messages to add, oldest first
+        """
+        self.messages.extend(messages)
+        self._dirty = True
+
+    def poll_dirty(self) -> bool:
+        """Check and reset the dirty flag.
+
+        Returns:
+            True if the view changed since the last poll
+        """
+        was_dirty = self._dirty
+        self._dirty = False
+        return was_dirty
 
     def set_agents(self, agents: List[BaseAgent]):
         """Set the list of agents to monitor.
@@ -292,6 +319,7 @@ class Dashboard:
     def clear_messages(self):
         """Clear the message history."""
         self.messages.clear()
+        self._dirty = True
 
 
 def create_dashboard(agents: Optional[List[BaseAgent]] = None) -> Dashboard:
@@ -8,6 +8,7 @@ from .retry import (
     retry_operation,
     retry_async_operation
 )
+from .concurrency import gather_bounded
 from .circuit_breaker import (
     CircuitBreaker,
     CircuitBreakerManager,
@@ -26,6 +27,8 @@ __all__ = [
     "async_retry_with_backoff",
     "retry_operation",
     "retry_async_operation",
+    # Concurrency
+    "gather_bounded",
     # Circuit Breaker
     "CircuitBreaker",
     "CircuitBreakerManager",
@@ -0,0 +1,46 @@
+"""
+Concurrency helpers for fanning out async work with a bound.
+
+An unbounded asyncio.gather over dozens of coroutines (e.g. one METAR
+fetch per ICAO code) can overrun upstream rate limits or flood a single
+MCP server session. gather_bounded keeps at most `limit` coroutines
+in flight while preserving result order.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Iterable, List
+
+
+async def gather_bounded(
+    coros: Iterable[Awaitable[Any]],
+    limit: int = 8,
+    return_exceptions: bool = False
+) -> List[Any]:
+    """
+    Run awaitables concurrently with at most `limit` in flight.
+
+    Results come back in the same order as the input, like
+    asyncio.gather. A semaphore gates entry, so handing this hundreds
+    of coroutines is safe: only `limit` of them touch the network (or
+    an MCP session) at a time.
+
+    Args:
+        coros: Awaitables to run
+        limit: Maximum number running concurrently
+        return_exceptions: If True, exceptions are returned in place of
+            results instead of being raised (gather semantics)
+
+    Returns:
+        List of results (and exceptions, if return_exceptions=True) in
+        input order
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _run(coro: Awaitable[Any]) -> Any:
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(
+        *(_run(coro) for coro in coros),
+        return_exceptions=return_exceptions
+    )
@@ -6,6 +6,8 @@ to start at specific points in a mission (e.g., on station, during drop run)
 without simulating the entire flight from takeoff.
 """
 
+import functools
+
 import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional, List
@@ -70,6 +72,62 @@ class MissionSnapshot:
         return msg
 
 
+@functools.lru_cache(maxsize=None)
+def _load_snapshot_file(snapshots_file: str) -> Dict[str, Dict[str, MissionSnapshot]]:
+    """
+    Read and parse a snapshots YAML file, memoized per path.
+
+    Every MissionSnapshotManager pointed at the same file shares one
+    parsed result, so scripts that build several managers (or rebuild
+    one per mission) only pay the YAML parse once per process. The
+    returned mapping is shared and must be treated as read-only.
+
+    Args:
+        snapshots_file: Path to the YAML file containing mission snapshots
+
+    Returns:
+        Dict mapping mission type to a dict of snapshot ID -> MissionSnapshot
+
+    Raises:
+        FileNotFoundError: If the snapshots file does not exist
+    """
+    path = Path(snapshots_file)
+    if not path.exists():
+        raise FileNotFoundError(f"Snapshots file not found: {path}")
+
+    with open(path, 'r') as f:
+        data = yaml.safe_load(f)
+
+    # Parse each mission type's snapshots
+    snapshots: Dict[str, Dict[str, MissionSnapshot]] = {}
+    for mission_type, snapshots_dict in data.items():
+        snapshots[mission_type] = {}
+
+        for snapshot_id, snapshot_data in snapshots_dict.items():
+            # Extract position data
+            pos = snapshot_data['position']
+
+            # Create snapshot object
+            snapshot = MissionSnapshot(
+                name=snapshot_data['name'],
+                description=snapshot_data['description'],
+                aircraft_model=snapshot_data['aircraft_model'],
+                latitude=pos['latitude'],
+                longitude=pos['longitude'],
+                altitude_msl=pos['altitude_msl'],
+                heading=pos['heading'],
+                airspeed=pos['airspeed'],
+                aircraft_state=snapshot_data['aircraft_state'],
+                mission_phase=snapshot_data['mission_phase'],
+                time_into_mission=snapshot_data.get('time_into_mission'),
+                next_action=snapshot_data.get('next_action')
+            )
+
+            snapshots[mission_type][snapshot_id] = snapshot
+
+    return snapshots
+
+
 class MissionSnapshotManager:
     """Manages loading and accessing mission snapshots."""
     
@@ -83,41 +141,11 @@ class MissionSnapshotManager:
         self.snapshots_file = Path(snapshots_file)
         self.snapshots: Dict[str, Dict[str, MissionSnapshot]] = {}
         self._load_snapshots()
-    
+
     def _load_snapshots(self):
-        """Load snapshots from the YAML file."""
-        if not self.snapshots_file.exists():
-            raise FileNotFoundError(f"Snapshots file not found: {self.snapshots_file}")
-        
-        with open(self.snapshots_file, 'r') as f:
-            data = yaml.safe_load(f)
-        
-        # Parse each mission type's snapshots
-        for mission_type, snapshots_dict in data.items():
-            self.snapshots[mission_type] = {}
-            
-            for snapshot_id, snapshot_data in snapshots_dict.items():
-                # Extract position data
-                pos = snapshot_data['position']
-                
-                # Create snapshot object
-                snapshot = MissionSnapshot(
-                    name=snapshot_data['name'],
-                    description=snapshot_data['description'],
-                    aircraft_model=snapshot_data['aircraft_model'],
-                    latitude=pos['latitude'],
-                    longitude=pos['longitude'],
-                    altitude_msl=pos['altitude_msl'],
-                    heading=pos['heading'],
-                    airspeed=pos['airspeed'],
-                    aircraft_state=snapshot_data['aircraft_state'],
-                    mission_phase=snapshot_data['mission_phase'],
-                    time_into_mission=snapshot_data.get('time_into_mission'),
-                    next_action=snapshot_data.get('next_action')
-                )
-                
-                self.snapshots[mission_type][snapshot_id] = snapshot
-    
+        """Load snapshots from the (per-path memoized) YAML file."""
+        self.snapshots = _load_snapshot_file(str(self.snapshots_file))
+
     def get_snapshot(self, mission_type: str, snapshot_id: str) -> Optional[MissionSnapshot]:
         """
         Get a specific snapshot.
@@ -130,7 +158,22 @@ class MissionSnapshotManager:
             MissionSnapshot object or None if not found
         """
         return self.snapshots.get(mission_type, {}).get(snapshot_id)
-    
+
+    def get_snapshots(self, mission_type: str, snapshot_ids: List[str]) -> Dict[str, MissionSnapshot]:
+        """
+        Get several snapshots of one mission type in a single call.
+
+        Args:
+            mission_type: Type of mission (e.g., 'airdrop_mission_snapshots')
+            snapshot_ids: IDs of the snapshots to retrieve
+
+        Returns:
+            Dict mapping each found ID to its MissionSnapshot; unknown IDs
+            are omitted
+        """
+        mission = self.snapshots.get(mission_type, {})
+        return {sid: mission[sid] for sid in snapshot_ids if sid in mission}
+
     def list_snapshots(self, mission_type: str) -> List[str]:
         """
         List all available snapshots for a mission type.
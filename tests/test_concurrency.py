@@ -0,0 +1,54 @@
+"""Tests for bounded concurrency helpers."""
+
+import asyncio
+
+from src.utils.concurrency import gather_bounded
+
+
+async def test_gather_bounded_preserves_order():
+    """Test that results come back in input order."""
+
+    async def delayed(value, delay):
+        await asyncio.sleep(delay)
+        return value
+
+    # Later coroutines finish first; order must still match the input
+    results = await gather_bounded([
+        delayed("a", 0.03),
+        delayed("b", 0.02),
+        delayed("c", 0.01),
+    ])
+
+    assert results == ["a", "b", "c"]
+
+
+async def test_gather_bounded_enforces_limit():
+    """Test that at most `limit` coroutines run at once."""
+    running = 0
+    peak = 0
+
+    async def tracked():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    await gather_bounded([tracked() for _ in range(10)], limit=3)
+
+    assert peak <= 3
+
+
+async def test_gather_bounded_return_exceptions():
+    """Test that failures are captured in place when requested."""
+
+    async def ok():
+        return "fine"
+
+    async def boom():
+        raise ValueError("broken")
+
+    results = await gather_bounded([ok(), boom()], return_exceptions=True)
+
+    assert results[0] == "fine"
+    assert isinstance(results[1], ValueError)
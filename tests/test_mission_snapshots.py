@@ -65,6 +65,24 @@ class TestMissionSnapshotManager:
         
         assert snapshot is None
     
+    def test_snapshot_file_parsed_once(self):
+        """Test that managers for the same file share one parsed result."""
+        first = MissionSnapshotManager()
+        second = MissionSnapshotManager()
+
+        assert first.snapshots is second.snapshots
+
+    def test_get_snapshots_bulk(self):
+        """Test getting several snapshots in one call."""
+        manager = MissionSnapshotManager()
+        snapshots = manager.get_snapshots(
+            "airdrop_mission_snapshots",
+            ["pre_takeoff", "return_to_base", "nonexistent"]
+        )
+
+        assert set(snapshots.keys()) == {"pre_takeoff", "return_to_base"}
+        assert isinstance(snapshots["pre_takeoff"], MissionSnapshot)
+
     def test_get_snapshot_summary(self):
         """Test getting a summary of snapshots."""
         manager = MissionSnapshotManager()
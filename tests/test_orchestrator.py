@@ -501,6 +501,26 @@ class TestTurnProcessing:
         assert turn_data["user_message"] is None
         assert len(turn_data["agent_responses"]) >= 0
 
+    @pytest.mark.asyncio
+    async def test_run_turn_and_report(self):
+        """Test running a turn and reporting responses to a stream."""
+        import io
+
+        orch = Orchestrator()
+        agent = MockAgent("agent-1", "ALPHA-ONE", should_respond_value=True)
+        orch.add_agent(agent)
+
+        out = io.StringIO()
+        responses = await orch.run_turn_and_report(
+            user_message="Test message",
+            max_agent_responses=1,
+            out=out
+        )
+
+        assert len(responses) == 1
+        assert "[ALPHA-ONE]" in out.getvalue()
+        assert "Response from ALPHA-ONE" in out.getvalue()
+
 
 class TestOrchestratorStatus:
     """Test orchestrator status and control."""
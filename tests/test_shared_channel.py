@@ -1,5 +1,7 @@
 """Tests for shared channel."""
 
+import asyncio
+
 import pytest
 from datetime import datetime, timedelta
 
@@ -78,6 +80,112 @@ def test_get_messages_for_agent():
     assert len(messages) >= 2
 
 
+def test_add_messages_bulk():
+    """Test adding a batch of messages in one pass."""
+    channel = SharedChannel(max_history=5)
+
+    created = channel.add_messages_bulk([
+        {"sender_id": f"agent{i}", "content": f"Message {i}"}
+        for i in range(8)
+    ])
+
+    assert len(created) == 8
+    # History trimmed once for the whole batch
+    assert channel.get_message_count() == 5
+    assert channel.get_recent_messages(1)[0].content == "Message 7"
+
+
+def test_add_messages_bulk_parses_recipient():
+    """Test that bulk-added messages still get protocol parsing."""
+    channel = SharedChannel()
+
+    created = channel.add_messages_bulk([{
+        "sender_id": "agent1",
+        "sender_callsign": "Alpha Lead",
+        "content": "Alpha One, this is Alpha Lead, status check, over."
+    }])
+
+    assert created[0].recipient_callsign is not None
+
+
+def test_iter_recent_non_system():
+    """Test iterating recent messages without user/system traffic."""
+    channel = SharedChannel()
+
+    channel.add_message(
+        sender_id="system",
+        content="Session started.",
+        message_type=MessageType.SYSTEM
+    )
+    channel.add_message(
+        sender_id="user",
+        content="Status check?",
+        message_type=MessageType.USER
+    )
+    channel.add_message(
+        sender_id="agent1",
+        content="All systems nominal.",
+        sender_callsign="Alpha One"
+    )
+
+    agent_messages = list(channel.iter_recent_non_system(10))
+
+    assert len(agent_messages) == 1
+    assert agent_messages[0].sender_id == "agent1"
+
+
+def test_get_recent_projection():
+    """Test projecting selected fields of recent messages as tuples."""
+    channel = SharedChannel()
+
+    channel.add_message(
+        sender_id="user",
+        content="Status check?",
+        message_type=MessageType.USER
+    )
+    channel.add_message(
+        sender_id="agent1",
+        content="All systems nominal.",
+        sender_callsign="Alpha One"
+    )
+
+    rows = list(channel.get_recent_projection(10))
+
+    assert rows == [
+        ("user", None, "Status check?"),
+        ("agent1", "Alpha One", "All systems nominal."),
+    ]
+
+    # Custom field selection
+    contents = list(channel.get_recent_projection(1, fields=("sender_id", "content")))
+    assert contents == [("agent1", "All systems nominal.")]
+
+
+async def test_wait_for_message():
+    """Test event-driven wait for a new message."""
+    channel = SharedChannel()
+
+    async def add_later():
+        await asyncio.sleep(0.01)
+        channel.add_message(sender_id="agent1", content="Ping")
+
+    task = asyncio.create_task(add_later())
+    msg = await asyncio.wait_for(channel.wait_for_message(), timeout=1.0)
+    await task
+
+    assert msg.content == "Ping"
+
+
+async def test_wait_for_message_already_pending():
+    """Test that a message added before waiting is seen immediately."""
+    channel = SharedChannel()
+    channel.add_message(sender_id="agent1", content="Early bird")
+
+    msg = await asyncio.wait_for(channel.wait_for_message(), timeout=1.0)
+
+    assert msg.content == "Early bird"
+
+
 def test_channel_clear():
     """Test clearing channel."""
     channel = SharedChannel()
@@ -14,6 +14,7 @@ import pytest
 import asyncio
 import os
 import json
+import pickle
 import tempfile
 from pathlib import Path
 from datetime import datetime
@@ -595,5 +596,108 @@ class TestSessionExport:
         os.rmdir(temp_dir)
 
 
+class TestIncrementalPersistence:
+    """Test the incremental message log and autosave."""
+
+    @pytest.mark.asyncio
+    async def test_persist_new_messages_writes_only_tail(self, state_manager, sample_channel):
+        """Test that repeated persists only write new messages."""
+        count = await state_manager.persist_new_messages("test-incremental", sample_channel)
+        assert count == 2
+
+        # Nothing new since the last persist
+        count = await state_manager.persist_new_messages("test-incremental", sample_channel)
+        assert count == 0
+
+        sample_channel.add_message(
+            sender_id="agent-2",
+            content="Alpha Two copies, over.",
+            sender_callsign="ALPHA-TWO",
+            message_type=MessageType.AGENT
+        )
+
+        count = await state_manager.persist_new_messages("test-incremental", sample_channel)
+        assert count == 1
+
+    @pytest.mark.asyncio
+    async def test_persist_new_messages_rows(self, state_manager, sample_channel, temp_db):
+        """Test that persisted messages land in the log with sequential keys."""
+        import aiosqlite
+
+        await state_manager.persist_new_messages("test-rows", sample_channel)
+
+        async with aiosqlite.connect(temp_db) as db:
+            cursor = await db.execute(
+                "SELECT seq FROM session_messages WHERE session_id = ? ORDER BY seq",
+                ("test-rows",)
+            )
+            rows = await cursor.fetchall()
+
+        assert [row[0] for row in rows] == [0, 1]
+
+    @pytest.mark.asyncio
+    async def test_autosave_flushes_on_stop(self, state_manager, sample_channel, temp_db):
+        """Test that stop_autosave persists messages added while streaming."""
+        import aiosqlite
+
+        state_manager.start_autosave("test-autosave", sample_channel)
+
+        sample_channel.add_message(
+            sender_id="agent-1",
+            content="Position update, over.",
+            sender_callsign="ALPHA-ONE",
+            message_type=MessageType.AGENT
+        )
+
+        # Let the autosave task wake on the new-message event
+        await asyncio.sleep(0.05)
+        await state_manager.stop_autosave()
+
+        async with aiosqlite.connect(temp_db) as db:
+            cursor = await db.execute(
+                "SELECT COUNT(*) FROM session_messages WHERE session_id = ?",
+                ("test-autosave",)
+            )
+            row = await cursor.fetchone()
+
+        assert row[0] == 3
+
+    @pytest.mark.asyncio
+    async def test_persist_new_messages_survives_history_trim(self, state_manager, temp_db):
+        """Test that persistence continues after the channel trims history."""
+        import aiosqlite
+
+        channel = SharedChannel(max_history=2)
+
+        channel.add_message(sender_id="agent-1", content="Message 0")
+        channel.add_message(sender_id="agent-1", content="Message 1")
+        count = await state_manager.persist_new_messages("test-trim", channel)
+        assert count == 2
+
+        # Push the history past max_history: messages 0 and 1 are trimmed
+        # from the live list, but they are already in the log
+        channel.add_message(sender_id="agent-1", content="Message 2")
+        channel.add_message(sender_id="agent-1", content="Message 3")
+
+        count = await state_manager.persist_new_messages("test-trim", channel)
+        assert count == 2
+
+        # Nothing new after the post-trim flush
+        count = await state_manager.persist_new_messages("test-trim", channel)
+        assert count == 0
+
+        async with aiosqlite.connect(temp_db) as db:
+            cursor = await db.execute(
+                "SELECT seq, message FROM session_messages"
+                " WHERE session_id = ? ORDER BY seq",
+                ("test-trim",)
+            )
+            rows = await cursor.fetchall()
+
+        assert [row[0] for row in rows] == [0, 1, 2, 3]
+        contents = [pickle.loads(row[1])["content"] for row in rows]
+        assert contents == [f"Message {i}" for i in range(4)]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])